@@ -1,17 +1,28 @@
 import re
 import threading
-from typing import TYPE_CHECKING
+from enum import Enum
+from functools import cached_property
+from typing import TYPE_CHECKING, Callable
 
 from framework.faasr_function_logger import FaaSrFunctionLogger, LogEvent
 from framework.utils import get_s3_path
 from framework.utils.enums import FunctionStatus
 
 if TYPE_CHECKING:
+    from framework.faasr_logger_pool import FaaSrLoggerPool
     from framework.s3_client import FaaSrS3Client
 else:
+    FaaSrLoggerPool = object
     FaaSrS3Client = object
 
 
+class FunctionEvent(Enum):
+    """Events that can be triggered by the FaaSrFunction"""
+
+    STATUS_CHANGED = "status_changed"
+    INVOCATIONS_EXTRACTED = "invocations_extracted"
+
+
 class FaaSrFunction:
     """
     Manages the execution status and monitoring of a single FaaSr function.
@@ -21,6 +32,7 @@ class FaaSrFunction:
     - Listening to logger events and updating status reactively
     - Tracking invocations from log analysis
     - Managing function completion and failure detection
+    - Providing event-driven callbacks for status and invocation changes
     """
 
     failed_regex = re.compile(r"\[[\d\.]+?\] \[ERROR\]")
@@ -35,15 +47,14 @@ class FaaSrFunction:
         workflow_name: str,
         invocation_folder: str,
         s3_client: FaaSrS3Client,
+        logger_pool: FaaSrLoggerPool,
         stream_logs: bool = False,
-        interval_seconds: int = 3,
     ):
         self.function_name = function_name
         self.workflow_name = workflow_name
         self.invocation_folder = invocation_folder
         self.s3_client = s3_client
         self.stream_logs = stream_logs
-        self.interval_seconds = interval_seconds
 
         # Initialize function logger
         self._logger = FaaSrFunctionLogger(
@@ -51,20 +62,25 @@ class FaaSrFunction:
             workflow_name=workflow_name,
             invocation_folder=invocation_folder,
             s3_client=s3_client,
+            logger_pool=logger_pool,
             stream_logs=stream_logs,
-            interval_seconds=interval_seconds,
         )
 
         # Status management
         self._status = FunctionStatus.PENDING
-        self._invocations: set[str] | None = None
+        self._invocations: frozenset[str] | None = None
+        self._done = False
 
         # Thread safety
         self._lock = threading.Lock()
 
-        # Register callbacks with logger
+        # Event callbacks (replaced on registration, so dispatch reads it without a lock)
+        self._callbacks: tuple[Callable[[FunctionEvent], None], ...] = ()
+
+        # Register callbacks with logger, and watch for the .done file
         self._logger.register_callback(self._on_log_event)
         self._logger.start()
+        logger_pool.watch(self.done_key, self._on_done)
 
     @property
     def status(self) -> FunctionStatus:
@@ -77,10 +93,11 @@ class FaaSrFunction:
         with self._lock:
             return self._status
 
-    @property
+    @cached_property
     def done_key(self) -> str:
         """
-        Get the complete `.done` file S3 key.
+        Get the complete `.done` file S3 key. This is computed once, since the function
+        name and invocation folder do not change.
 
         This replaces ranks with the expected format
         (e.g. "function(1)" -> "function.1.done").
@@ -94,17 +111,16 @@ class FaaSrFunction:
         )
 
     @property
-    def invocations(self) -> set[str] | None:
+    def invocations(self) -> frozenset[str] | None:
         """
-        Get the invocations (thread-safe).
+        Get the invocations (thread-safe). The invocations are immutable, so they are
+        returned without copying.
 
         Returns:
-            set[str] | None: The invocations.
+            frozenset[str] | None: The invocations, or None if not yet extracted.
         """
         with self._lock:
-            if self._invocations is None:
-                return None
-            return self._invocations.copy()
+            return self._invocations
 
     def set_status(self, status: FunctionStatus) -> None:
         """
@@ -114,8 +130,35 @@ class FaaSrFunction:
             status: The new status to set.
         """
         with self._lock:
+            changed = self._status != status
             self._status = status
 
+        if changed:
+            self._call_callbacks(FunctionEvent.STATUS_CHANGED)
+
+    def register_callback(self, callback: Callable[[FunctionEvent], None]) -> None:
+        """
+        Register a callback to be called when function events occur.
+
+        Args:
+            callback: Function to call with FunctionEvent parameter
+        """
+        with self._lock:
+            self._callbacks = (*self._callbacks, callback)
+
+    def _call_callbacks(self, event: FunctionEvent) -> None:
+        """
+        Call all registered callbacks with the given event.
+
+        Args:
+            event: The function event that occurred
+        """
+        for callback in self._callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                self._logger.logger.error(f"Error in callback: {e}")
+
     def start(self) -> None:
         """Start monitoring the function."""
         self._logger.start()
@@ -135,6 +178,18 @@ class FaaSrFunction:
             case LogEvent.LOG_COMPLETE:
                 self._handle_log_complete()
 
+    def _on_done(self) -> None:
+        """
+        Handle when the .done file is listed by the logger pool.
+
+        If the logs have already started, this rechecks the status immediately, since
+        the .done file may be written after the last log update.
+        """
+        with self._lock:
+            self._done = True
+        if self._logger.logs_started:
+            self._handle_log_updated()
+
     def _handle_log_created(self) -> None:
         """Handle when logs are first created."""
         # Function is now running
@@ -172,12 +227,14 @@ class FaaSrFunction:
 
     def _check_for_completion(self) -> bool:
         """
-        Check if the function has completed by looking for the .done file.
+        Check if the function has completed. The .done file is watched by the logger
+        pool's listing of the invocation folder, so this makes no S3 requests.
 
         Returns:
             bool: True if the function has completed, False otherwise.
         """
-        return self.s3_client.object_exists(self.done_key)
+        with self._lock:
+            return self._done
 
     def _extract_invocations(self) -> None:
         """
@@ -187,10 +244,11 @@ class FaaSrFunction:
         """
         logs_content = self._logger.logs_content
         with self._lock:
-            self._invocations = set(
+            self._invocations = frozenset(
                 re.sub(r"^" + self.workflow_name + "-", "", invocation)
                 for invocation in self.invoked_regex.findall(logs_content)
             )
+        self._call_callbacks(FunctionEvent.INVOCATIONS_EXTRACTED)
 
     @property
     def logs(self) -> list[str]:
@@ -1,12 +1,13 @@
 import logging
-import re
 import threading
 import time
 from enum import Enum
+from functools import cached_property
 from typing import Callable
 
-from framework.s3_client import FaaSrS3Client
-from framework.utils import get_s3_path
+from framework.faasr_logger_pool import FaaSrLoggerPool
+from framework.s3_client import FaaSrS3Client, S3ObjectInfo
+from framework.utils import get_s3_path, split_log_entries
 
 
 class LogEvent(Enum):
@@ -17,10 +18,34 @@ class LogEvent(Enum):
     LOG_COMPLETE = "log_complete"
 
 
+def _setup_root_logger() -> logging.Logger:
+    """
+    Initialize the parent logger shared by all FaaSrFunctionLoggers. A single handler
+    is attached here, and log outputs include the function logger's name.
+
+    Returns:
+        logging.Logger: The parent logger.
+    """
+    logger = logging.getLogger("FaaSrFunctionLogger")
+    handler = logging.StreamHandler()
+    formatter = logging.Formatter("[%(name)s] %(message)s")
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+_root_logger = _setup_root_logger()
+
+
 class FaaSrFunctionLogger:
     """
     Handles log monitoring and fetching for a single FaaSr function.
 
+    Logs are monitored by a shared `FaaSrLoggerPool`, which calls `poll` once per
+    monitoring cycle.
+
     This class is responsible for:
     - Monitoring logs on S3 for a specific function
     - Fetching and storing log content
@@ -32,12 +57,10 @@ class FaaSrFunctionLogger:
         workflow_name: The name of the workflow.
         invocation_folder: The folder where the logs are stored.
         s3_client: The S3 client to use.
+        logger_pool: The logger pool that monitors the logs.
         stream_logs: Whether to stream the logs to the console.
-        interval_seconds: The interval in seconds to check for new logs.
     """
 
-    entry_regex = re.compile(r"\[[\d\.]+?\][\s\S]+?(?=\n\[)|\[[\d\.]+?\][\s\S]+?$")
-
     def __init__(
         self,
         *,
@@ -45,49 +68,38 @@ class FaaSrFunctionLogger:
         workflow_name: str,
         invocation_folder: str,
         s3_client: FaaSrS3Client,
+        logger_pool: FaaSrLoggerPool,
         stream_logs: bool = False,
-        interval_seconds: int = 3,
     ):
         self.function_name = function_name
         self.workflow_name = workflow_name
         self.invocation_folder = invocation_folder
         self.s3_client = s3_client
+        self.logger_pool = logger_pool
         self.stream_logs = stream_logs
-        self.interval_seconds = interval_seconds
 
-        # Setup logger
-        self.logger_name = f"FaaSrFunctionLogger-{function_name}"
-        self.logger = self._setup_logger()
+        # Setup logger (a child of the shared FaaSrFunctionLogger logger)
+        self.logger = _root_logger.getChild(function_name)
+        self.logger_name = self.logger.name
 
-        # Log storage
-        self._logs: list[str] = []
+        # Log storage (complete log entries, and the raw bytes of the last entry)
+        self._buf = bytearray()
+        self._entries: list[str] = []
+        self._byte_offset = 0
+        self._streamed_count = 0
+        self._last_etag: str | None = None
 
         # State tracking
         self._logs_started = False
         self._logs_complete = False
 
-        # Thread management
-        self._thread: threading.Thread | None = None
+        # Thread safety
         self._lock = threading.Lock()
         self._stop_requested = False
+        self._stop_requested_at: float | None = None
 
-        # Event callbacks
-        self._callbacks: list[Callable[[LogEvent], None]] = []
-
-    def _setup_logger(self) -> logging.Logger:
-        """
-        Initialize the FaaSrFunctionLogger logger. Log outputs include the function name.
-
-        Returns:
-            logging.Logger: The logger for the FaaSrFunctionLogger.
-        """
-        logger = logging.getLogger(self.logger_name)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(f"[{self.logger_name}] %(message)s")
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-        return logger
+        # Event callbacks (replaced on registration, so dispatch reads it without a lock)
+        self._callbacks: tuple[Callable[[LogEvent], None], ...] = ()
 
     @property
     def logs(self) -> list[str]:
@@ -98,7 +110,8 @@ class FaaSrFunctionLogger:
             list[str]: The logs.
         """
         with self._lock:
-            return self._logs.copy()
+            tail, _ = split_log_entries(self._buf, final=True)
+            return self._entries + tail
 
     @property
     def logs_content(self) -> str:
@@ -108,13 +121,13 @@ class FaaSrFunctionLogger:
         Returns:
             str: The logs content.
         """
-        with self._lock:
-            return "\n".join(self._logs)
+        return "\n".join(self.logs)
 
-    @property
+    @cached_property
     def logs_key(self) -> str:
         """
-        Get the complete logs S3 key.
+        Get the complete logs S3 key. This is computed once, since the function name
+        and invocation folder do not change.
 
         Returns:
             str: The S3 key for the logs.
@@ -165,7 +178,7 @@ class FaaSrFunctionLogger:
             callback: Function to call with LogEvent parameter
         """
         with self._lock:
-            self._callbacks.append(callback)
+            self._callbacks = (*self._callbacks, callback)
 
     def _call_callbacks(self, event: LogEvent) -> None:
         """
@@ -180,15 +193,19 @@ class FaaSrFunctionLogger:
             except Exception as e:
                 self.logger.error(f"Error in callback: {e}")
 
-    def _update_logs(self, new_logs: list[str]) -> None:
+    def _update_logs(self, new_bytes: bytes) -> None:
         """
-        Update the logs (thread-safe).
+        Update the logs (thread-safe). Only the appended bytes are parsed into entries,
+        and only the bytes of the last (possibly incomplete) entry are kept.
 
         Args:
-            new_logs: The new logs to add to the logs.
+            new_bytes: The new log bytes to append to the logs.
         """
         with self._lock:
-            self._logs += new_logs
+            self._buf.extend(new_bytes)
+            entries, end = split_log_entries(self._buf)
+            del self._buf[:end]
+            self._entries.extend(entries)
 
     def _set_logs_started(self) -> None:
         """Set the logs started flag to True (thread-safe)."""
@@ -200,69 +217,122 @@ class FaaSrFunctionLogger:
         with self._lock:
             self._logs_complete = True
 
-    def _check_for_logs(self) -> bool:
+    def _get_logs(self, logs_object: S3ObjectInfo) -> bytes | None:
         """
-        Check if the logs exist on S3.
+        Get the log bytes appended on S3 since the last fetch.
+
+        Args:
+            logs_object: The listed logs object.
 
         Returns:
-            bool: True if logs exist on S3, False otherwise.
+            bytes: The new log bytes.
+            None: If the logs do not exist on S3 or have not changed.
         """
-        return self.s3_client.object_exists(self.logs_key)
+        logs = self.s3_client.get_object_if_changed(
+            self.logs_key, self._last_etag, range_start=self._byte_offset
+        )
+        if logs is None or logs.not_modified:
+            return None
 
-    def _get_logs(self) -> list[str]:
+        self._last_etag = logs.etag or logs_object.etag
+        self._byte_offset += len(logs.body)
+        return logs.body
+
+    def _pop_new_entries(self, final: bool = False) -> list[str]:
         """
-        Get the logs from S3.
+        Get the log entries that have not been streamed yet (thread-safe).
+
+        The last entry is held back until the next entry starts, since later fetches
+        may append more lines to it.
+
+        Args:
+            final: Whether to also return the last entry.
 
         Returns:
-            list[str]: The logs.
+            list[str]: The new log entries.
         """
-        logs = self.s3_client.get_object(self.logs_key).strip()
-        return self.entry_regex.findall(logs)
+        with self._lock:
+            entries = self._entries[self._streamed_count :]
+            self._streamed_count = len(self._entries)
+            if final:
+                tail, _ = split_log_entries(self._buf, final=True)
+                entries.extend(tail)
+        return entries
 
     def start(self) -> None:
-        """Start the FaaSrFunctionLogger."""
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        """Start the FaaSrFunctionLogger by registering it with the logger pool."""
+        self.logger_pool.register(self)
 
     def stop(self) -> None:
-        """Stop the FaaSrFunctionLogger."""
+        """
+        Stop the FaaSrFunctionLogger. The logs are completed on the first monitoring
+        cycle that starts at least `interval_seconds` after the stop and fetches no new
+        logs, so trailing log lines written around the `.done` file are not missed.
+        """
         with self._lock:
             self._stop_requested = True
+            self._stop_requested_at = time.monotonic()
+        self.logger_pool.wake_after(self.logger_pool.interval_seconds)
 
-    def _run(self) -> None:
+    def poll(self, logs_object: S3ObjectInfo | None, listed_at: float) -> bool:
         """
-        Run the main logging loop.
+        Run a single monitoring cycle. This is called by the logger pool.
 
-        Until logs are complete, this:
-        - Fetches new logs from S3.
+        This:
+        - Fetches the bytes appended to the logs on S3 if the listed logs object
+          changed.
         - Updates the logs.
         - Triggers appropriate events.
-        - Sets the logs complete flag if no new logs were fetched after a monitoring
-          cycle.
+        - Sets the logs complete flag if no new logs were fetched in a cycle listed at
+          least `interval_seconds` after a stop was requested, and unregisters from
+          the logger pool.
 
         If `stream_logs` is True, this will also log the logs to the console.
+
+        Args:
+            logs_object: The listed logs object, or None if the logs do not exist.
+            listed_at: The `time.monotonic()` time at which the cycle's listing started.
+
+        Returns:
+            bool: True if new logs were found, False otherwise.
         """
-        while not self.logs_complete:
-            if not self.logs_started:
-                if self._check_for_logs():
-                    self._set_logs_started()
-                    self._call_callbacks(LogEvent.LOG_CREATED)
-            else:
-                log_content = self._get_logs()
-                num_existing_logs = len(self.logs)
-                new_logs = log_content[num_existing_logs:]
-
-                if new_logs:
-                    self._update_logs(new_logs)
-                    self._call_callbacks(LogEvent.LOG_UPDATED)
-
-                    if self.stream_logs:
-                        for log in new_logs:
-                            self.logger.info(log)
-
-                # Check if logs are complete (no new logs after a cycle)
-                if self.stop_requested and not new_logs:
-                    self._set_logs_complete()
-                    self._call_callbacks(LogEvent.LOG_COMPLETE)
-
-            time.sleep(self.interval_seconds)
+        # Snapshot the state once. The stop flag is read before fetching, so logs
+        # written before the stop was requested are always fetched before completing.
+        with self._lock:
+            logs_complete = self._logs_complete
+            logs_started = self._logs_started
+            stop_requested_at = self._stop_requested_at
+
+        if logs_complete or logs_object is None:
+            return False
+
+        if not logs_started:
+            self._set_logs_started()
+            self._call_callbacks(LogEvent.LOG_CREATED)
+
+        new_bytes = None
+        if logs_object.etag != self._last_etag:
+            new_bytes = self._get_logs(logs_object)
+
+        if new_bytes:
+            self._update_logs(new_bytes)
+            self._call_callbacks(LogEvent.LOG_UPDATED)
+
+        # Check if logs are complete (no new logs in a cycle listed after the grace
+        # period following the stop)
+        logs_complete = (
+            stop_requested_at is not None
+            and listed_at - stop_requested_at >= self.logger_pool.interval_seconds
+            and not new_bytes
+        )
+
+        if self.stream_logs:
+            for log in self._pop_new_entries(final=logs_complete):
+                self.logger.info(log)
+
+        if logs_complete:
+            self._set_logs_complete()
+            self.logger_pool.unregister(self)
+            self._call_callbacks(LogEvent.LOG_COMPLETE)
+
+        return bool(new_bytes)
@@ -0,0 +1,271 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable
+
+from framework.s3_client import FaaSrS3Client, S3ClientError, S3ObjectInfo
+from framework.utils import get_s3_path
+
+if TYPE_CHECKING:
+    from framework.faasr_function_logger import FaaSrFunctionLogger
+    from framework.s3_event_notifier import S3EventNotifier
+else:
+    FaaSrFunctionLogger = object
+    S3EventNotifier = object
+
+
+class FaaSrLoggerPool:
+    """
+    Monitors the logs of all FaaSr functions in an invocation with a single thread.
+
+    Each monitoring cycle lists the invocation folder once and dispatches the listed
+    objects to the registered loggers, so M functions cost one LIST per cycle instead of
+    M independent pollers. Loggers are polled concurrently on a shared executor, so
+    fetching several changed logs costs about one GET round trip.
+
+    This class is responsible for:
+    - Registering and unregistering function loggers
+    - Listing the invocation folder once per monitoring cycle
+    - Dispatching the listed log objects to each registered logger
+    - Notifying watchers when a watched key is first listed
+    - Waiting for the next cycle (polling or S3 event notifications)
+    - Backing off the polling interval while no new logs appear
+
+    Args:
+        invocation_folder: The folder where the logs are stored.
+        s3_client: The S3 client to use.
+        interval_seconds: The interval in seconds to check for new logs.
+        max_interval_seconds: The maximum interval in seconds to back off to when
+            consecutive cycles find no new logs.
+        notifier: An optional S3 event notifier. When set, the pool waits for an S3
+            event in the invocation folder instead of polling every `interval_seconds`.
+        max_workers: The maximum number of loggers to poll concurrently.
+    """
+
+    logger_name = "FaaSrLoggerPool"
+
+    # Fallback wait when using S3 event notifications, in case an event is missed
+    notification_timeout_seconds = 60
+
+    def __init__(
+        self,
+        *,
+        invocation_folder: str,
+        s3_client: FaaSrS3Client,
+        interval_seconds: int = 3,
+        max_interval_seconds: int = 15,
+        notifier: S3EventNotifier | None = None,
+        max_workers: int = 10,
+    ):
+        self.invocation_folder = invocation_folder
+        self.s3_client = s3_client
+        self.interval_seconds = interval_seconds
+        self.max_interval_seconds = max_interval_seconds
+        self.notifier = notifier
+        self.logger = logging.getLogger(self.logger_name)
+
+        # Registered loggers by logs key, and watch callbacks by watched key
+        self._loggers: dict[str, FaaSrFunctionLogger] = {}
+        self._watches: dict[str, list[Callable[[], None]]] = {}
+
+        # Thread management
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._stop_requested = False
+        self._wake = threading.Event()
+        self._current_interval_seconds = interval_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=self.logger_name
+        )
+
+        # Wake up the pool when any object in the invocation folder is written
+        if self.notifier is not None:
+            self.notifier.subscribe(self.prefix, lambda key: self._wake.set())
+
+    @property
+    def prefix(self) -> str:
+        """
+        Get the S3 key prefix of the invocation folder.
+
+        Returns:
+            str: The S3 key prefix.
+        """
+        return get_s3_path(f"{self.invocation_folder}/")
+
+    @property
+    def stop_requested(self) -> bool:
+        """
+        Get the stop flag (thread-safe).
+
+        Returns:
+            bool: True if the pool's stop flag is set, False otherwise.
+        """
+        with self._lock:
+            return self._stop_requested
+
+    def register(self, logger: FaaSrFunctionLogger) -> None:
+        """
+        Register a logger to be polled on each monitoring cycle.
+
+        Args:
+            logger: The logger to register.
+        """
+        with self._lock:
+            self._loggers[logger.logs_key] = logger
+        self.wake()
+
+    def unregister(self, logger: FaaSrFunctionLogger) -> None:
+        """
+        Unregister a logger.
+
+        Args:
+            logger: The logger to unregister.
+        """
+        with self._lock:
+            self._loggers.pop(logger.logs_key, None)
+
+    def watch(self, key: str, callback: Callable[[], None]) -> None:
+        """
+        Register a callback to be called once when a key in the invocation folder is
+        first listed. This replaces polling the key with HEAD requests.
+
+        Args:
+            key: The S3 key to watch.
+            callback: Function to call when the key exists.
+        """
+        with self._lock:
+            self._watches.setdefault(key, []).append(callback)
+        self.wake()
+
+    def wake(self) -> None:
+        """Start the next monitoring cycle without waiting."""
+        self._wake.set()
+
+    def wake_after(self, delay_seconds: float) -> None:
+        """
+        Start a monitoring cycle no later than `delay_seconds` from now, even if the
+        pool is backed off or waiting for S3 event notifications.
+
+        Args:
+            delay_seconds: The delay in seconds before waking the pool.
+        """
+        timer = threading.Timer(delay_seconds, self.wake)
+        timer.daemon = True
+        timer.start()
+
+    def start(self) -> None:
+        """Start the FaaSrLoggerPool."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the FaaSrLoggerPool."""
+        with self._lock:
+            self._stop_requested = True
+        self._wake.set()
+
+    def _wait(self) -> None:
+        """
+        Wait before the next monitoring cycle.
+
+        Without a notifier, this waits for `interval_seconds`, doubling for each
+        consecutive cycle without new logs up to `max_interval_seconds`. With a
+        notifier, this blocks until an S3 event in the invocation folder arrives.
+        Either wait ends early when `wake` is called.
+        """
+        if self.notifier is None:
+            self._wake.wait(timeout=self._current_interval_seconds)
+        else:
+            self._wake.wait(timeout=self.notification_timeout_seconds)
+
+    def _poll_loggers(self) -> bool:
+        """
+        Run a single monitoring cycle. This lists the invocation folder once,
+        concurrently passes each registered logger its listed logs object, and then
+        calls the watch callbacks of listed keys. Watches run after the loggers, so a
+        callback sees the logs fetched in the same cycle (e.g. an `[ERROR]` line written
+        just before the `.done` file).
+
+        Returns:
+            bool: True if any watched key appeared or any logger found new logs, False
+                otherwise.
+        """
+        with self._lock:
+            loggers = list(self._loggers.values())
+            watched = bool(self._watches)
+
+        if not loggers and not watched:
+            return False
+
+        listed_at = time.monotonic()
+        objects = self.s3_client.list_objects(self.prefix)
+        new_logs = False
+
+        futures = {
+            self._executor.submit(
+                logger.poll, objects.get(logger.logs_key), listed_at
+            ): logger
+            for logger in loggers
+        }
+        for future in as_completed(futures):
+            try:
+                new_logs |= future.result()
+            except Exception as e:
+                self.logger.error(f"Error polling {futures[future].function_name}: {e}")
+
+        new_logs |= self._notify_watches(objects)
+        return new_logs
+
+    def _notify_watches(self, objects: dict[str, S3ObjectInfo]) -> bool:
+        """
+        Call and remove the watch callbacks of all listed keys.
+
+        Args:
+            objects: The listed objects by key.
+
+        Returns:
+            bool: True if any watched key was listed, False otherwise.
+        """
+        with self._lock:
+            callbacks = [
+                callback
+                for key in self._watches.keys() & objects.keys()
+                for callback in self._watches.pop(key)
+            ]
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Error in watch callback: {e}")
+        return bool(callbacks)
+
+    def _run(self) -> None:
+        """
+        Run the main monitoring loop.
+
+        Until a stop is requested, this polls all registered loggers and waits for the
+        next cycle. The executor is shut down when the loop exits.
+        """
+        while not self.stop_requested:
+            # Clear before checking S3 so events arriving mid-cycle are not lost
+            self._wake.clear()
+
+            try:
+                new_logs = self._poll_loggers()
+            except S3ClientError as e:
+                self.logger.error(f"Error listing {self.prefix}: {e}")
+                new_logs = False
+
+            # Back off while idle, and return to the base interval on activity
+            if new_logs:
+                self._current_interval_seconds = self.interval_seconds
+            else:
+                self._current_interval_seconds = min(
+                    self._current_interval_seconds * 2, self.max_interval_seconds
+                )
+
+            self._wait()
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
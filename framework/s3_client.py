@@ -1,8 +1,15 @@
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, NamedTuple
 
-import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from framework.utils.boto_session import create_client
+from framework.utils.request_stats import RequestStats
+from framework.utils.single_flight import SingleFlight
 from framework.utils.throttled_client import ThrottledClient
 
 
@@ -28,6 +35,85 @@ class S3ClientError(Exception):
         return f"S3 client error: {self.message}"
 
 
+class S3Object(NamedTuple):
+    """An object fetched from S3 with a conditional GET"""
+
+    body: bytes
+    etag: str | None
+    not_modified: bool = False
+
+
+class S3ObjectInfo(NamedTuple):
+    """An object listed in S3"""
+
+    size: int
+    etag: str
+
+
+# Shared client configuration. The connection pool is sized for concurrent loggers
+# (botocore defaults to 10), and adaptive retries back off on throttling responses.
+_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    connect_timeout=3,
+    read_timeout=10,
+    tcp_keepalive=True,
+)
+
+
+@lru_cache(maxsize=None)
+def _get_boto_client(
+    endpoint: str | None,
+    region: str,
+    access_key: str,
+    secret_key: str,
+    max_pool_connections: int | None = None,
+):
+    """
+    Get a boto3 S3 client, shared by all `FaaSrS3Client` instances with the same
+    datastore and credentials, and the request stats collected from it.
+
+    boto3 clients are thread-safe, so sharing one client avoids repeating endpoint and
+    credential resolution and reuses the same HTTP connection pool across loggers. The
+    stats hooks are registered once, when the client is created.
+
+    Args:
+        endpoint: The S3 endpoint URL, or None for AWS S3.
+        region: The S3 region.
+        access_key: The S3 access key.
+        secret_key: The S3 secret key.
+        max_pool_connections: The HTTP connection pool size, or None for the default.
+
+    Returns:
+        The boto3 S3 client and its request stats.
+    """
+    config = _CONFIG
+    if max_pool_connections is not None:
+        config = config.merge(Config(max_pool_connections=max_pool_connections))
+
+    if endpoint:
+        client = create_client(
+            "s3",
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            region_name=region,
+            endpoint_url=endpoint,
+            config=config,
+        )
+    else:
+        client = create_client(
+            "s3",
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            region_name=region,
+            config=config,
+        )
+
+    stats = RequestStats()
+    stats.register(client.meta.events, "s3")
+    return client, stats
+
+
 class FaaSrS3Client:
     """
     A client for interacting with FaaSr S3 datastores.
@@ -36,11 +122,24 @@ class FaaSrS3Client:
     - Initializing the S3 client
     - Checking if objects exist in S3
     - Getting objects from S3
+    - Getting objects from S3 only if they changed
+    - Listing objects in S3
+    - Caching fetched objects, revalidated against S3 on every read
+    - Optionally caching existence checks, so concurrent checks share one HEAD request
+    - Reporting request stats
 
     Args:
         workflow_data: The FaaSr workflow data.
         access_key: The FaaSr S3 access key.
         secret_key: The FaaSr S3 secret key.
+        cache_max_bytes: The maximum total size of cached object bodies.
+        exists_ttl_seconds: How long an existence check result is reused. Defaults to
+            0, so every check reflects the current state of the bucket, as the
+            integration test assertions require.
+        max_pool_connections: The HTTP connection pool size. Increase this with the
+            number of functions logged concurrently. Defaults to 64.
+        max_concurrent_requests: The maximum number of concurrent S3 requests. This
+            should not exceed the HTTP connection pool size.
 
     Raises:
         `S3ClientInitializationError`: If the S3 client initialization fails.
@@ -52,28 +151,35 @@ class FaaSrS3Client:
         workflow_data: dict[str, Any],
         access_key: str,
         secret_key: str,
+        cache_max_bytes: int = 16 * 1024 * 1024,
+        exists_ttl_seconds: float = 0,
+        max_pool_connections: int | None = None,
+        max_concurrent_requests: int = 10,
     ):
+        # Existence checks in flight, and cached object bodies by key: (etag, body)
+        self._flight = SingleFlight()
+        self._cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._cache_bytes = 0
+        self._cache_max_bytes = cache_max_bytes
+        self._cache_lock = threading.Lock()
+
+        # Existence check results by key: (exists, expiry time)
+        self._exists_cache: dict[str, tuple[bool, float]] = {}
+        self._exists_ttl_seconds = exists_ttl_seconds
+
         try:
             default_datastore = workflow_data.get("DefaultDataStore", "S3")
             datastore_config = workflow_data["DataStores"][default_datastore]
 
-            if datastore_config.get("Endpoint"):
-                client = boto3.client(
-                    "s3",
-                    aws_access_key_id=access_key,
-                    aws_secret_access_key=secret_key,
-                    region_name=datastore_config["Region"],
-                    endpoint_url=datastore_config["Endpoint"],
-                )
-            else:
-                client = boto3.client(
-                    "s3",
-                    aws_access_key_id=access_key,
-                    aws_secret_access_key=secret_key,
-                    region_name=datastore_config["Region"],
-                )
+            client, self._stats = _get_boto_client(
+                datastore_config.get("Endpoint"),
+                datastore_config["Region"],
+                access_key,
+                secret_key,
+                max_pool_connections,
+            )
 
-            self._client = ThrottledClient(client)
+            self._client = ThrottledClient(client, queue_size=max_concurrent_requests)
             self._bucket_name = datastore_config["Bucket"]
 
         except ClientError as e:
@@ -87,6 +193,10 @@ class FaaSrS3Client:
         """
         Check if the object exists in S3.
 
+        If `exists_ttl_seconds` is positive, results are reused for that long and
+        concurrent calls for the same key share a single HEAD request. Otherwise, each
+        call issues its own HEAD request.
+
         Args:
             key: The key of the object to check.
 
@@ -96,19 +206,56 @@ class FaaSrS3Client:
         Raises:
             S3ClientError: If an error occurs.
         """
+        if self._exists_ttl_seconds <= 0:
+            return self._head_object(key)
+
+        with self._cache_lock:
+            cached = self._exists_cache.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        return self._flight.do(("object_exists", key), self._head_object, key)
+
+    def _head_object(self, key: str) -> bool:
+        """Issue the HEAD request for `object_exists`, caching the result if enabled."""
         try:
             self._client.head_object(Bucket=self._bucket_name, Key=key)
         except ClientError as e:
             if e.response["Error"]["Code"] == "404":
-                return False
+                exists = False
             else:
                 raise S3ClientError(f"Error checking object existence: {e}") from e
-        return True
+        else:
+            exists = True
+
+        if self._exists_ttl_seconds > 0:
+            with self._cache_lock:
+                self._exists_cache[key] = (
+                    exists,
+                    time.monotonic() + self._exists_ttl_seconds,
+                )
+        return exists
+
+    def stats(self) -> dict[str, float]:
+        """
+        Get the request stats of the underlying boto3 client (thread-safe).
+
+        Stats are shared by all clients for the same datastore and credentials. See
+        `RequestStats` for the recorded counts.
+
+        Returns:
+            dict[str, float]: The counts by name (e.g. "GetObject.304").
+        """
+        return self._stats.snapshot()
 
     def get_object(self, key: str, encoding: str = "utf-8") -> str:
         """
         Get the object from S3.
 
+        Object bodies are cached by ETag and revalidated with a conditional GET on every
+        call, so the result always reflects the object's current state, and an unchanged
+        object is not downloaded again.
+
         Args:
             key: The key of the object to get.
             encoding: The encoding to use for the object.
@@ -120,14 +267,134 @@ class FaaSrS3Client:
             S3ClientError: If the object does not exist or an error occurs.
         """
         try:
-            return (
-                self._client.get_object(Bucket=self._bucket_name, Key=key)["Body"]
-                .read()
-                .decode(encoding)
-            )
+            body = self._get_cached_object(key)
+            return body.decode(encoding)
+        except S3ClientError:
+            raise
+        except Exception as e:
+            raise S3ClientError(f"Unhandled error getting object: {e}") from e
+
+    def _get_cached_object(self, key: str) -> bytes:
+        """
+        Get the object body from the cache, revalidating it against S3.
+
+        Args:
+            key: The key of the object to get.
+
+        Returns:
+            The object body.
+
+        Raises:
+            S3ClientError: If the object does not exist or an error occurs.
+        """
+        with self._cache_lock:
+            cached = self._cache.get(key)
+
+        obj = self.get_object_if_changed(key, cached[0] if cached else None)
+        if obj is None:
+            raise S3ClientError(f"Object does not exist: {key}")
+        if obj.not_modified:
+            return cached[1]
+
+        self._cache_object(key, obj.etag, obj.body)
+        return obj.body
+
+    def _cache_object(self, key: str, etag: str | None, body: bytes) -> None:
+        """
+        Cache an object body, evicting the least recently cached objects when the
+        cache exceeds `cache_max_bytes`.
+
+        Args:
+            key: The key of the object.
+            etag: The ETag of the object.
+            body: The object body.
+        """
+        if etag is None or len(body) > self._cache_max_bytes:
+            return
+
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache_bytes -= len(self._cache.pop(key)[1])
+            self._cache[key] = (etag, body)
+            self._cache_bytes += len(body)
+
+            while self._cache_bytes > self._cache_max_bytes:
+                _, (_, evicted) = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
+
+    def get_object_if_changed(
+        self, key: str, etag: str | None = None, range_start: int = 0
+    ) -> S3Object | None:
+        """
+        Get the object from S3 if its ETag differs from the given ETag.
+
+        This issues a single conditional GET (`If-None-Match`), so an unchanged object
+        costs one request and transfers no body. For objects that only grow, such as
+        logs, `range_start` fetches only the bytes after the last fetched version. If
+        the object changed but has no bytes after `range_start`, the body is empty.
+
+        Args:
+            key: The key of the object to get.
+            etag: The ETag of the last fetched version of the object, if any.
+            range_start: The byte offset to start reading from.
+
+        Returns:
+            The object body and ETag, with `not_modified` set if the object is unchanged.
+            None: If the object does not exist.
+
+        Raises:
+            S3ClientError: If an error occurs.
+        """
+        kwargs = {"Bucket": self._bucket_name, "Key": key}
+        if etag is not None:
+            kwargs["IfNoneMatch"] = etag
+        if range_start:
+            kwargs["Range"] = f"bytes={range_start}-"
+
+        try:
+            response = self._client.get_object(**kwargs)
+            return S3Object(body=response["Body"].read(), etag=response.get("ETag"))
         except ClientError as e:
-            if e.response["Error"]["Code"] == "404":
-                raise S3ClientError(f"Object does not exist: {e}") from e
+            code = e.response["Error"]["Code"]
+            if code in ("304", "NotModified"):
+                return S3Object(body=b"", etag=etag, not_modified=True)
+            if code in ("404", "NoSuchKey"):
+                return None
+            if code in ("416", "InvalidRange"):
+                headers = e.response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+                return S3Object(body=b"", etag=headers.get("etag"))
             raise S3ClientError(f"boto3 client error getting object: {e}") from e
         except Exception as e:
             raise S3ClientError(f"Unhandled error getting object: {e}") from e
+
+    def list_objects(self, prefix: str) -> dict[str, S3ObjectInfo]:
+        """
+        List all objects under a prefix in S3.
+
+        Args:
+            prefix: The key prefix to list.
+
+        Returns:
+            A mapping of object keys to their size and ETag.
+
+        Raises:
+            S3ClientError: If an error occurs.
+        """
+        objects: dict[str, S3ObjectInfo] = {}
+        kwargs = {"Bucket": self._bucket_name, "Prefix": prefix}
+
+        try:
+            while True:
+                response = self._client.list_objects_v2(**kwargs)
+                for obj in response.get("Contents", []):
+                    objects[obj["Key"]] = S3ObjectInfo(
+                        size=obj["Size"], etag=obj["ETag"]
+                    )
+
+                if not response.get("IsTruncated"):
+                    return objects
+                kwargs["ContinuationToken"] = response["NextContinuationToken"]
+        except ClientError as e:
+            raise S3ClientError(f"boto3 client error listing objects: {e}") from e
+        except Exception as e:
+            raise S3ClientError(f"Unhandled error listing objects: {e}") from e
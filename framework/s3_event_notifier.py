@@ -0,0 +1,197 @@
+import json
+import logging
+import threading
+import time
+from typing import Callable
+from urllib.parse import unquote_plus
+
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+
+from framework.utils.boto_session import create_client
+
+
+class S3EventNotifier:
+    """
+    Delivers S3 object-created events from an SQS queue to subscribers.
+
+    The bucket must be configured with an `s3:ObjectCreated:*` event notification
+    targeting the SQS queue. A single background thread long-polls the queue, so
+    subscribers are only woken when an object is actually written instead of polling
+    S3 on a fixed interval.
+
+    This class is responsible for:
+    - Long-polling the SQS queue for S3 event notifications
+    - Parsing object keys from S3 event records
+    - Dispatching keys to subscribers registered by key prefix
+    - Deleting messages that matched a subscriber from the queue
+
+    Messages that match no subscriber are left on the queue, so they become visible
+    again after the visibility timeout. This lets several runners (for example,
+    concurrent test runs of different invocations) share one queue without consuming
+    each other's events.
+
+    Args:
+        queue_url: The URL of the SQS queue receiving S3 event notifications.
+        region: The region of the SQS queue.
+        access_key: The access key for the SQS queue.
+        secret_key: The secret key for the SQS queue.
+        wait_time_seconds: The SQS long-polling wait time (max 20 seconds).
+    """
+
+    logger_name = "S3EventNotifier"
+    retry_seconds = 5
+
+    def __init__(
+        self,
+        *,
+        queue_url: str,
+        region: str,
+        access_key: str,
+        secret_key: str,
+        wait_time_seconds: int = 20,
+    ):
+        self.queue_url = queue_url
+        self.wait_time_seconds = wait_time_seconds
+        self.logger = logging.getLogger(self.logger_name)
+
+        # The read timeout must outlast the long poll, and keepalive lets the
+        # connection be reused across polls
+        self._client = create_client(
+            "sqs",
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            region_name=region,
+            config=Config(
+                read_timeout=wait_time_seconds + 10,
+                tcp_keepalive=True,
+                retries={"mode": "adaptive", "max_attempts": 10},
+            ),
+        )
+
+        # Thread management
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._stop_requested = False
+
+        # Subscribers
+        self._subscribers: list[tuple[str, Callable[[str], None]]] = []
+
+    @property
+    def stop_requested(self) -> bool:
+        """
+        Get the stop flag (thread-safe).
+
+        Returns:
+            bool: True if the notifier's stop flag is set, False otherwise.
+        """
+        with self._lock:
+            return self._stop_requested
+
+    def subscribe(self, prefix: str, callback: Callable[[str], None]) -> None:
+        """
+        Register a callback for objects created under a key prefix.
+
+        Args:
+            prefix: The key prefix to match (an exact key also matches).
+            callback: Function to call with the created object key.
+        """
+        with self._lock:
+            self._subscribers.append((prefix, callback))
+
+    def start(self) -> None:
+        """Start the S3EventNotifier."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the S3EventNotifier after the current long poll returns."""
+        with self._lock:
+            self._stop_requested = True
+
+    def _dispatch(self, key: str) -> bool:
+        """
+        Call all subscribers whose prefix matches the key.
+
+        Args:
+            key: The key of the created object.
+
+        Returns:
+            bool: True if any subscriber matched the key, False otherwise.
+        """
+        with self._lock:
+            subscribers = self._subscribers.copy()
+
+        matched = False
+        for prefix, callback in subscribers:
+            if key.startswith(prefix):
+                matched = True
+                try:
+                    callback(key)
+                except Exception as e:
+                    self.logger.error(f"Error in subscriber: {e}")
+        return matched
+
+    @staticmethod
+    def _parse_keys(body: str) -> list[str]:
+        """
+        Parse the created object keys from an SQS message body.
+
+        Args:
+            body: The SQS message body.
+
+        Returns:
+            list[str]: The object keys. S3 URL-encodes keys in event records.
+        """
+        try:
+            records = json.loads(body).get("Records", [])
+        except (json.JSONDecodeError, AttributeError):
+            return []
+
+        return [
+            unquote_plus(record["s3"]["object"]["key"])
+            for record in records
+            if record.get("eventName", "").startswith("ObjectCreated")
+        ]
+
+    def _run(self) -> None:
+        """
+        Run the main notification loop.
+
+        Until a stop is requested, this:
+        - Blocks on an SQS long poll until messages arrive.
+        - Dispatches each created object key to matching subscribers.
+        - Deletes the messages that matched a subscriber from the queue.
+        """
+        while not self.stop_requested:
+            try:
+                response = self._client.receive_message(
+                    QueueUrl=self.queue_url,
+                    WaitTimeSeconds=self.wait_time_seconds,
+                    MaxNumberOfMessages=10,
+                )
+            except (BotoCoreError, ClientError) as e:
+                self.logger.error(f"Error receiving messages: {e}")
+                time.sleep(self.retry_seconds)
+                continue
+
+            # Only consume messages meant for this runner's subscribers
+            messages = []
+            for message in response.get("Messages", []):
+                matched = [
+                    self._dispatch(key) for key in self._parse_keys(message["Body"])
+                ]
+                if any(matched):
+                    messages.append(message)
+
+            if messages:
+                try:
+                    self._client.delete_message_batch(
+                        QueueUrl=self.queue_url,
+                        Entries=[
+                            {"Id": str(i), "ReceiptHandle": message["ReceiptHandle"]}
+                            for i, message in enumerate(messages)
+                        ],
+                    )
+                except (BotoCoreError, ClientError) as e:
+                    self.logger.error(f"Error deleting messages: {e}")
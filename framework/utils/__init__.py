@@ -11,12 +11,14 @@ from .utils import (
     pending,
     running,
     skipped,
+    split_log_entries,
     timed_out,
 )
 
 __all__ = [
     "extract_function_name",
     "get_s3_path",
+    "split_log_entries",
     "pending",
     "invoked",
     "not_invoked",
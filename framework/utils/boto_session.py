@@ -0,0 +1,24 @@
+import threading
+from typing import Any
+
+import boto3
+
+# boto3 sessions are not thread-safe, so all clients are created from one shared
+# session under a lock. Credential providers and service models are loaded once.
+_session = boto3.session.Session()
+_session_lock = threading.Lock()
+
+
+def create_client(service_name: str, **kwargs: Any) -> Any:
+    """
+    Create a boto3 client from the shared session (thread-safe).
+
+    Args:
+        service_name: The name of the AWS service (e.g. "s3", "sqs").
+        kwargs: The keyword arguments to pass to `Session.client`.
+
+    Returns:
+        The boto3 client.
+    """
+    with _session_lock:
+        return _session.client(service_name, **kwargs)
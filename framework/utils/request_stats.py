@@ -0,0 +1,80 @@
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+from botocore.hooks import BaseEventHooks
+
+
+class RequestStats:
+    """
+    Counts requests made by a boto3 client using botocore event hooks.
+
+    The hooks run inside botocore for each API call, so no wrapper is needed on the
+    request path. For each operation, this records:
+    - `<operation>`: The number of calls
+    - `<operation>.<status>`: The number of calls by HTTP status code (e.g. 304, 416)
+    - `<operation>.bytes`: The total response body size
+    - `<operation>.seconds`: The total time until the response headers were parsed
+      (for streamed bodies such as GetObject, this is the time to first byte)
+
+    Example Usage:
+        ```python
+        stats = RequestStats()
+        stats.register(client.meta.events, "s3")
+        client.head_object(Bucket="my-bucket", Key="my-key")
+        stats.snapshot()  # {"HeadObject": 1, "HeadObject.200": 1, ...}
+        ```
+    """
+
+    _start_time_key = "request_stats_start_time"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Counter[str] = Counter()
+
+    def register(self, events: BaseEventHooks, service: str) -> None:
+        """
+        Register the hooks on a client's event system.
+
+        Args:
+            events: The client's event system (`client.meta.events`).
+            service: The service ID of the client (e.g. "s3").
+        """
+        events.register(f"before-call.{service}", self._on_before_call)
+        events.register(f"after-call.{service}", self._on_after_call)
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        Get a copy of the current counts (thread-safe).
+
+        Returns:
+            dict[str, float]: The counts by name.
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def _on_before_call(self, context: dict[str, Any], **kwargs: Any) -> None:
+        """Record the start time of an API call in its request context."""
+        context[self._start_time_key] = time.perf_counter()
+
+    def _on_after_call(
+        self,
+        http_response: Any,
+        parsed: dict[str, Any],
+        model: Any,
+        context: dict[str, Any],
+        **kwargs: Any,
+    ) -> None:
+        """Count a completed API call."""
+        elapsed = time.perf_counter() - context.pop(
+            self._start_time_key, time.perf_counter()
+        )
+        operation = model.name
+        body_size = parsed.get("ContentLength", 0) if operation != "HeadObject" else 0
+
+        with self._lock:
+            self._counts[operation] += 1
+            self._counts[f"{operation}.{http_response.status_code}"] += 1
+            self._counts[f"{operation}.bytes"] += body_size
+            self._counts[f"{operation}.seconds"] += elapsed
@@ -0,0 +1,67 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Hashable, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into a single call.
+
+    The first caller for a key runs the function. Callers that arrive while it is
+    running wait for and share its result (or exception) instead of running the
+    function again.
+
+    Example Usage:
+        ```python
+        flight = SingleFlight()
+        flight.do(("my-bucket", "my-key"), client.head_object, Bucket="my-bucket", Key="my-key")
+        ```
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future] = {}
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[P, R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        """
+        Call the function, or wait for an in-flight call with the same key.
+
+        Args:
+            key: The key identifying identical calls.
+            fn: The function to call.
+            args: The arguments to pass to the function.
+            kwargs: The keyword arguments to pass to the function.
+
+        Returns:
+            The result of the function call.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
@@ -1,6 +1,12 @@
+import re
+from functools import lru_cache
+
 from framework.utils.enums import FunctionStatus
 
+_log_entry_regex = re.compile(rb"\[[\d\.]+?\][\s\S]+?(?=\n\[)|\[[\d\.]+?\][\s\S]+?\Z")
+
 
+@lru_cache(maxsize=None)
 def extract_function_name(function_name: str) -> str:
     return function_name.split("(")[0]
 
@@ -9,6 +15,41 @@ def get_s3_path(key: str) -> str:
     return key.replace("\\", "/")
 
 
+def split_log_entries(
+    data: bytes | bytearray,
+    start: int = 0,
+    final: bool = False,
+) -> tuple[list[str], int]:
+    """
+    Split raw FaaSr log bytes into log entries, starting at a byte offset.
+
+    Each entry starts with a `[timestamp]` and runs until the next line starting with
+    `[`. The scan runs directly on the bytes, and only the returned entries are decoded.
+
+    Args:
+        data: The raw log bytes.
+        start: The byte offset to start splitting from.
+        final: Whether the data is complete. If False, the last entry is not returned,
+            since more lines may be appended to it.
+
+    Returns:
+        tuple[list[str], int]: The log entries, and the byte offset after the last
+            returned entry.
+    """
+    if final:
+        end = len(data)
+        while end > start and data[end - 1] in b" \t\r\n\x0b\x0c":
+            end -= 1
+    else:
+        end = data.rfind(b"\n[", start)
+
+    if end <= start:
+        return [], start
+
+    entries = _log_entry_regex.findall(data, start, end)
+    return [entry.decode("utf-8") for entry in entries], end
+
+
 def pending(status: FunctionStatus) -> bool:
     return status == FunctionStatus.PENDING
 
@@ -4,28 +4,27 @@ import signal
 import sys
 import threading
 import time
-from collections import defaultdict
 from datetime import UTC, datetime
+from functools import partial
 from itertools import chain
-from typing import Generator, Literal
+from types import MappingProxyType
+from typing import Generator, Literal, Mapping
 
 from FaaSr_py import FaaSrPayload
 from FaaSr_py.helpers.graph_functions import build_adjacency_graph
 from FaaSr_py.helpers.s3_helper_functions import get_invocation_folder
 
 from faasr_workflow.scripts.invoke_workflow import main
-from framework.faasr_function import FaaSrFunction
+from framework.faasr_function import FaaSrFunction, FunctionEvent
+from framework.faasr_logger_pool import FaaSrLoggerPool
 from framework.s3_client import FaaSrS3Client
+from framework.s3_event_notifier import S3EventNotifier
 from framework.utils import (
-    completed,
     extract_function_name,
     failed,
     has_completed,
     has_final_state,
-    invoked,
-    not_invoked,
     pending,
-    running,
 )
 from framework.utils.enums import FunctionStatus, InvocationStatus
 
@@ -37,6 +36,32 @@ REQUIRED_ENV_VARS = [
     "GITHUB_REF_NAME",
 ]
 
+# Log message formats for status changes (other statuses are logged where they are set)
+_STATUS_LOG_FMT: dict[FunctionStatus, str] = {
+    FunctionStatus.FAILED: "Function %s failed",
+    FunctionStatus.NOT_INVOKED: "Function %s not invoked",
+    FunctionStatus.INVOKED: "Function %s invoked",
+    FunctionStatus.RUNNING: "Function %s running",
+    FunctionStatus.COMPLETED: "Function %s completed",
+}
+
+# Status prefixes for the example CLI
+_EMOJI: dict[FunctionStatus, str] = {
+    FunctionStatus.PENDING: "⏳",
+    FunctionStatus.INVOKED: "🚀",
+    FunctionStatus.NOT_INVOKED: "ℹ️",
+    FunctionStatus.RUNNING: "🔄",
+    FunctionStatus.COMPLETED: "✅",
+    FunctionStatus.FAILED: "‼️",
+    FunctionStatus.SKIPPED: " ",
+    FunctionStatus.TIMEOUT: " ",
+}
+
+
+def _force_exit(signum, frame):
+    """Signal handler that exits immediately, for a second interruption signal."""
+    sys.exit(signum)
+
 
 class InitializationError(Exception):
     """Exception raised for WorkflowRunner initialization errors"""
@@ -71,8 +96,12 @@ class WorkflowRunner:
     Args:
         faasr_payload: The FaaSr payload.
         timeout: The timeout for the monitoring thread.
-        check_interval: The interval for the monitoring thread.
+        check_interval: The maximum interval between monitoring checks. Checks also run
+            as soon as any function's status or invocations change. With S3 event
+            notifications, checks only run on changes or when the timeout expires.
         stream_logs: Whether to stream the logs to the console.
+        max_workers: The maximum number of function logs fetched concurrently, and of
+            concurrent S3 requests.
 
     Raises:
         InitializationError: If the environment is not valid.
@@ -87,6 +116,7 @@ class WorkflowRunner:
         timeout: int,
         check_interval: int,
         stream_logs: bool = False,
+        max_workers: int = 10,
     ):
         self._validate_environment()
         self._faasr_payload = faasr_payload
@@ -102,10 +132,14 @@ class WorkflowRunner:
         self.seconds_since_last_change: float = 0.0
 
         # Thread management
-        self._status_lock = threading.Lock()
+        # Reentrant, since signal handlers run on the main thread and may interrupt it
+        # while it holds the lock
+        self._status_lock = threading.RLock()
         self._monitoring_thread = None
         self._monitoring_complete = False
         self._shutdown_requested = False
+        self._wake_event = threading.Event()
+        self._change_event = threading.Event()
         self._cleanup_timeout = 30  # seconds to wait for graceful shutdown
 
         # Build adjacency graph for monitoring
@@ -117,16 +151,41 @@ class WorkflowRunner:
         self.workflow_invoke = self._faasr_payload.get("FunctionInvoke")
         self.function_names = self._faasr_payload["ActionList"].keys()
         self._stream_logs = stream_logs
+        self._max_workers = max_workers
         self._functions: dict[str, FaaSrFunction] = {}
+        self._logger_pool: FaaSrLoggerPool | None = None
         self._prev_statuses: dict[str, FunctionStatus] = {}
 
+        # Read-only snapshot of function statuses, replaced on each status change
+        self._status_snapshot: Mapping[str, FunctionStatus] = MappingProxyType({})
+
+        # Precompute the ranks of each function, the invoker ranks and invoked ranks of
+        # each function, and the topological level of each function
+        self._ranks_list = {
+            name: tuple(self._iter_ranks(name)) for name in self.function_names
+        }
+        self._invokers_of = self._build_invokers_of()
+        self._invoked_of = self._build_invoked_of()
+        self._topo_levels = self._build_topological_levels()
+
+        # Pending functions to check on the next tick, since an invoker's invocations
+        # changed. Initially, all functions are checked.
+        self._ready_set: set[str] = set()
+
+        # Functions that have completed, maintained from status change events
+        self._completed_set: set[str] = set()
+
         # Initialize S3 client for monitoring
         self.s3_client = FaaSrS3Client(
             workflow_data=self._faasr_payload,
             access_key=os.getenv("S3_AccessKey"),
             secret_key=os.getenv("S3_SecretKey"),
+            max_concurrent_requests=max_workers,
         )
 
+        # Initialize S3 event notifier if an SQS queue is configured
+        self.notifier = self._build_notifier()
+
         # Setup signal handlers for graceful shutdown
         self._setup_signal_handlers()
 
@@ -166,28 +225,166 @@ class WorkflowRunner:
         logger.setLevel(logging.INFO)
         return logger
 
-    def _build_reverse_adjacency_graph(self) -> dict[str, set[str]]:
+    def _build_reverse_adjacency_graph(self) -> dict[str, tuple[str, ...]]:
         """
         Initialize the reverse adjacency graph:
 
         ```py
         {
-            "invoker": [
-                "invoked_function",
-                "invoked_function",
+            "invoked_function": (
+                "invoker",
+                "invoker",
                 ...
-            ]
+            )
         }
         ```
 
+        The graph is read-only after construction, so invokers are stored as sorted
+        tuples for compact storage and a deterministic iteration order. Every function
+        has an entry, and edges in the adjacency graph are already unique.
+
         Returns:
-            dict[str, set[str]]: The reverse adjacency graph.
+            dict[str, tuple[str, ...]]: The reverse adjacency graph.
         """
-        reverse_adj_graph = defaultdict(set)
+        reverse_adj_graph: dict[str, list[str]] = {
+            name: [] for name in self._faasr_payload["ActionList"]
+        }
         for invoker, invoked_functions in self.adj_graph.items():
             for function in invoked_functions:
-                reverse_adj_graph[function].add(invoker)
-        return reverse_adj_graph
+                if function in reverse_adj_graph:
+                    reverse_adj_graph[function].append(invoker)
+        return {
+            function: tuple(sorted(invokers))
+            for function, invokers in reverse_adj_graph.items()
+        }
+
+    def _build_invokers_of(self) -> dict[str, tuple[str, ...]]:
+        """
+        Initialize the invoker ranks of each function:
+
+        ```py
+        {
+            "invoked_function": (
+                "invoker",
+                "ranked_invoker(1)",
+                "ranked_invoker(2)",
+                ...
+            )
+        }
+        ```
+
+        Returns:
+            dict[str, tuple[str, ...]]: The invoker ranks of each function.
+        """
+        return {
+            function: tuple(
+                chain.from_iterable(self._ranks_list[invoker] for invoker in invokers)
+            )
+            for function, invokers in self.reverse_adj_graph.items()
+        }
+
+    def _build_invoked_of(self) -> dict[str, tuple[str, ...]]:
+        """
+        Initialize the ranks of the functions each function may invoke:
+
+        ```py
+        {
+            "invoker": (
+                "invoked_function",
+                "ranked_invoked_function(1)",
+                "ranked_invoked_function(2)",
+                ...
+            )
+        }
+        ```
+
+        Returns:
+            dict[str, tuple[str, ...]]: The invoked ranks of each function.
+        """
+        return {
+            invoker: tuple(
+                chain.from_iterable(
+                    self._ranks_list[function]
+                    for function in invoked_functions
+                    if function in self._ranks_list
+                )
+            )
+            for invoker, invoked_functions in self.adj_graph.items()
+        }
+
+    def _build_topological_levels(self) -> dict[str, int]:
+        """
+        Initialize the topological level of each function using Kahn's algorithm.
+
+        Functions that are not invoked by any other function are at level 0, and each
+        other function is one level below its deepest invoker. Functions in a cycle are
+        placed after all other functions.
+
+        Returns:
+            dict[str, int]: The topological level of each function.
+        """
+        in_degree = dict.fromkeys(self.function_names, 0)
+        for invoked_functions in self.adj_graph.values():
+            for function in invoked_functions:
+                if function in in_degree:
+                    in_degree[function] += 1
+
+        levels: dict[str, int] = {}
+        level = 0
+        frontier = [name for name, degree in in_degree.items() if degree == 0]
+        while frontier:
+            next_frontier = []
+            for name in frontier:
+                levels[name] = level
+                for function in self.adj_graph.get(name, ()):
+                    if function in in_degree:
+                        in_degree[function] -= 1
+                        if in_degree[function] == 0:
+                            next_frontier.append(function)
+            frontier = next_frontier
+            level += 1
+
+        for name in self.function_names:
+            levels.setdefault(name, level)
+        return levels
+
+    def _build_notifier(self) -> S3EventNotifier | None:
+        """
+        Initialize the S3 event notifier from the `S3_QueueURL` environment variable.
+
+        The queue must receive `s3:ObjectCreated:*` notifications from the default
+        datastore bucket. If `S3_QueueURL` is not set, the logger pool falls back to
+        polling S3.
+
+        Returns:
+            S3EventNotifier | None: The S3 event notifier, or None if not configured.
+        """
+        queue_url = os.getenv("S3_QueueURL")
+        if not queue_url:
+            return None
+
+        default_datastore = self._faasr_payload.get("DefaultDataStore", "S3")
+        datastore_config = self._faasr_payload["DataStores"][default_datastore]
+        return S3EventNotifier(
+            queue_url=queue_url,
+            region=datastore_config["Region"],
+            access_key=os.getenv("S3_AccessKey"),
+            secret_key=os.getenv("S3_SecretKey"),
+        )
+
+    def _build_logger_pool(self) -> FaaSrLoggerPool:
+        """
+        Initialize the logger pool that monitors the logs of all functions.
+
+        Returns:
+            FaaSrLoggerPool: The logger pool.
+        """
+        return FaaSrLoggerPool(
+            invocation_folder=get_invocation_folder(self._faasr_payload),
+            s3_client=self.s3_client,
+            notifier=self.notifier,
+            max_workers=self._max_workers,
+        )
 
     def _build_functions(self, stream_logs: bool) -> list[FaaSrFunction]:
         """
@@ -205,21 +402,26 @@ class WorkflowRunner:
         - The `WorkflowInvoke` function is initially set to `INVOKED`.
         - All other functions are initially set to `PENDING`.
         - Ranked functions include the rank in the function name.
+        - Functions are ordered by topological level, so invokers are monitored before
+          the functions they invoke.
 
         Returns:
             list[FaaSrFunction]: The function instances.
         """
         functions: dict[str, FaaSrFunction] = {}
-        for rank in chain(*(self._iter_ranks(name) for name in self.function_names)):
+        names = sorted(self.function_names, key=self._topo_levels.__getitem__)
+        for rank in chain.from_iterable(self._ranks_list[name] for name in names):
             function = FaaSrFunction(
                 function_name=rank,
                 workflow_name=self.workflow_name,
                 invocation_folder=get_invocation_folder(self._faasr_payload),
                 s3_client=self.s3_client,
+                logger_pool=self._logger_pool,
                 stream_logs=stream_logs,
             )
             if extract_function_name(rank) == self.workflow_invoke:
                 function.set_status(FunctionStatus.INVOKED)
+            function.register_callback(partial(self._on_function_event, function))
             functions[rank] = function
         return functions
 
@@ -227,18 +429,19 @@ class WorkflowRunner:
         """
         Setup signal handlers for graceful shutdown on interruption.
 
-        - Control-C and SIGTERM will initiate a graceful shutdown.
+        - Control-C and SIGTERM will initiate a graceful shutdown. The handler only
+          requests the shutdown; the monitoring thread observes it and finishes
+          monitoring, marking unfinished functions as skipped.
         - A second signal will force shutdown.
         """
 
         def signal_handler(signum, frame):
-            signal.signal(signal.SIGINT, lambda signum, frame: sys.exit(signum))
-            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(signum))
+            signal.signal(signal.SIGINT, _force_exit)
+            signal.signal(signal.SIGTERM, _force_exit)
             self.logger.info(
                 f"Received signal {signum}, initiating graceful shutdown..."
             )
-            self.shutdown()
-            sys.exit(0)
+            self._set_shutdown_requested()
 
         # Register signal handlers for common interruption signals
         signal.signal(signal.SIGINT, signal_handler)  # Ctrl+C
@@ -247,18 +450,17 @@ class WorkflowRunner:
     #########################
     # Thread-safe interface #
     #########################
-    def get_function_statuses(self) -> dict[str, FunctionStatus]:
+    def get_function_statuses(self) -> Mapping[str, FunctionStatus]:
         """
-        Get a copy of function statuses (thread-safe).
+        Get a snapshot of function statuses (thread-safe).
+
+        The snapshot is read-only and is replaced whenever a status changes, so this
+        returns it without locking or copying.
 
         Returns:
-            dict[str, FunctionStatus]: A copy of the function statuses.
+            Mapping[str, FunctionStatus]: A read-only snapshot of the function statuses.
         """
-        with self._status_lock:
-            return {
-                function.function_name: function.status
-                for function in self._functions.values()
-            }
+        return self._status_snapshot
 
     @property
     def monitoring_complete(self) -> bool:
@@ -282,15 +484,37 @@ class WorkflowRunner:
         with self._status_lock:
             return self._shutdown_requested
 
+    def wait_for_change(self, timeout: float | None = None) -> bool:
+        """
+        Wait until a function status changes or monitoring completes (thread-safe).
+
+        Changes made after the previous call returned are not missed, so a single
+        observer can loop over reading statuses and calling this.
+
+        Args:
+            timeout: The maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            bool: True if a change occurred, False if the timeout expired.
+        """
+        changed = self._change_event.wait(timeout=timeout)
+        self._change_event.clear()
+        return changed
+
     def _set_monitoring_complete(self) -> None:
         """Set the monitoring complete status to True (thread-safe)."""
         with self._status_lock:
             self._monitoring_complete = True
+        self._change_event.set()
 
     def _set_shutdown_requested(self) -> None:
-        """Set the shutdown requested status to True (thread-safe)."""
+        """
+        Set the shutdown requested status to True and wake up the monitoring thread
+        (thread-safe).
+        """
         with self._status_lock:
             self._shutdown_requested = True
+        self._wake_event.set()
 
     #######################
     # Workflow monitoring #
@@ -300,7 +524,7 @@ class WorkflowRunner:
         Start workflow monitoring. This:
 
         - Resets the monitoring timer.
-        - Calls `_monitor_workflow_execution` in a loop until:
+        - Calls `_monitor_workflow_execution` each time a function changes, until:
             - The monitoring timer times out.
             - A shutdown request is set.
             - `StopMonitoring` is raised.
@@ -313,13 +537,16 @@ class WorkflowRunner:
         self._reset_timer()
 
         while not self._did_timeout() and not self.shutdown_requested:
+            # Clear before checking so changes made mid-check are not lost
+            self._wake_event.clear()
+
             try:
                 self._monitor_workflow_execution()
             except StopMonitoring:
                 break
 
+            self._wait_for_change()
             self._increment_timer()
-            time.sleep(self.check_interval)
 
         self._finish_monitoring()
 
@@ -327,7 +554,8 @@ class WorkflowRunner:
         """
         Monitor the workflow execution. This:
 
-        - Checks the completion status for each function.
+        - Checks the invocation status of each pending function whose invokers' invocations
+          changed since the last check.
         - Starts a function instance if the function has run and no instance exists.
         - Handles changes in each function status.
         - Cascades a failure to all pending functions when any function fails.
@@ -337,9 +565,12 @@ class WorkflowRunner:
         """
         workflow_failed = False
 
+        with self._status_lock:
+            ready_set, self._ready_set = self._ready_set, set()
+
         # Check completion status for each function
         for function in self._functions.values():
-            if pending(function.status):
+            if pending(function.status) and function.function_name in ready_set:
                 self._handle_pending(function)
             if self._prev_statuses[function.function_name] != function.status:
                 self._log_status_change(function)
@@ -360,6 +591,49 @@ class WorkflowRunner:
     ######################
     # Monitoring helpers #
     ######################
+    def _on_function_event(self, function: FaaSrFunction, event: FunctionEvent) -> None:
+        """
+        Handle events from the functions by waking up the monitoring thread.
+
+        When a function's status changes, the completed set is updated. When a function's
+        invocations are extracted, the functions it may invoke are added to the ready
+        set, so their invocation status is checked on the next tick.
+
+        Args:
+            function: The function that triggered the event
+            event: The function event that occurred
+        """
+        if event == FunctionEvent.STATUS_CHANGED:
+            with self._status_lock:
+                self._status_snapshot = MappingProxyType(
+                    {**self._status_snapshot, function.function_name: function.status}
+                )
+                if has_completed(function.status):
+                    self._completed_set.add(function.function_name)
+                else:
+                    self._completed_set.discard(function.function_name)
+            self._change_event.set()
+        elif event == FunctionEvent.INVOCATIONS_EXTRACTED:
+            invoked_ranks = self._invoked_of.get(
+                extract_function_name(function.function_name), ()
+            )
+            with self._status_lock:
+                self._ready_set.update(invoked_ranks)
+        self._wake_event.set()
+
+    def _wait_for_change(self) -> None:
+        """
+        Wait until a function changes, a shutdown is requested, or:
+
+        - The monitoring timer times out.
+        - Without S3 event notifications, `check_interval` elapses.
+        """
+        elapsed = time.time() - self.last_change_time
+        timeout = max(self.timeout - elapsed, 0)
+        if self.notifier is None:
+            timeout = min(timeout, self.check_interval)
+        self._wake_event.wait(timeout=timeout)
+
     def _handle_pending(self, function: FaaSrFunction) -> None:
         """
         Handle a pending function.
@@ -379,24 +653,16 @@ class WorkflowRunner:
             function.set_status(FunctionStatus.NOT_INVOKED)
 
     def _log_status_change(self, function: FaaSrFunction) -> None:
-        if failed(function.status):
-            self.logger.info(f"Function {function.function_name} failed")
-        elif not_invoked(function.status):
-            self.logger.info(f"Function {function.function_name} not invoked")
-        elif invoked(function.status):
-            self.logger.info(f"Function {function.function_name} invoked")
-        elif running(function.status):
-            self.logger.info(f"Function {function.function_name} running")
-        elif completed(function.status):
-            self.logger.info(f"Function {function.function_name} completed")
+        log_fmt = _STATUS_LOG_FMT.get(function.status)
+        if log_fmt is not None:
+            self.logger.info(log_fmt, function.function_name)
 
     def _all_functions_completed(self) -> bool:
         """
-        Check if all functions have completed.
+        Check if all functions have completed (thread-safe).
         """
-        return all(
-            has_completed(function.status) for function in self._functions.values()
-        )
+        with self._status_lock:
+            return len(self._completed_set) == len(self._functions)
 
     def _finish_monitoring(self) -> None:
         """
@@ -473,27 +739,27 @@ class WorkflowRunner:
         Returns:
             bool: True if shutdown was successful, False if timeout occurred
         """
-        if not self._monitoring_thread or not self._monitoring_thread.is_alive():
+        thread = self._monitoring_thread
+        if thread is None or not thread.is_alive():
             return True
 
-        if self._monitoring_thread and self._monitoring_thread.is_alive():
-            self.logger.info("Requesting graceful shutdown of monitoring thread...")
+        self.logger.info("Requesting graceful shutdown of monitoring thread...")
 
-            # Signal shutdown request
-            self._set_shutdown_requested()
+        # Signal shutdown request
+        self._set_shutdown_requested()
 
-            # Wait for thread to finish gracefully
-            wait_timeout = timeout if timeout is not None else self._cleanup_timeout
-            self._monitoring_thread.join(timeout=wait_timeout)
+        # Wait for thread to finish gracefully
+        wait_timeout = timeout if timeout is not None else self._cleanup_timeout
+        thread.join(timeout=wait_timeout)
 
-        if self._monitoring_thread.is_alive():
+        if thread.is_alive():
             self.logger.warning(
                 f"Monitoring thread did not shutdown within {wait_timeout}s"
             )
             return False
-        else:
-            self.logger.info("Monitoring thread shutdown successfully")
-            return True
+
+        self.logger.info("Monitoring thread shutdown successfully")
+        return True
 
     def force_shutdown(self) -> None:
         """Force shutdown of the monitoring thread."""
@@ -515,6 +781,12 @@ class WorkflowRunner:
             self.logger.warning("Graceful shutdown failed, forcing shutdown...")
             self.force_shutdown()
 
+        # Stop monitoring function logs and receiving S3 events
+        if self._logger_pool is not None:
+            self._logger_pool.stop()
+        if self.notifier is not None:
+            self.notifier.stop()
+
         self.logger.info("Cleanup completed")
 
     @classmethod
@@ -523,6 +795,7 @@ class WorkflowRunner:
         timeout: int,
         check_interval: int,
         stream_logs: bool = False,
+        max_workers: int = 10,
     ) -> "WorkflowRunner":
         """
         Trigger a workflow and initialize the workflow runner.
@@ -531,6 +804,8 @@ class WorkflowRunner:
             timeout: The timeout for the monitoring thread.
             check_interval: The interval for the monitoring thread.
             stream_logs: Whether to stream the logs to the console.
+            max_workers: The maximum number of function logs fetched concurrently, and
+                of concurrent S3 requests.
 
         Returns:
             WorkflowRunner: The initialized workflow runner.
@@ -541,19 +816,40 @@ class WorkflowRunner:
             timeout=timeout,
             check_interval=check_interval,
             stream_logs=stream_logs,
+            max_workers=max_workers,
         )
         runner._start()
         return runner
 
     def _start(self):
         # Build functions after trigger_workflow initializes FaaSrPayload
+        self._logger_pool = self._build_logger_pool()
         self._functions = self._build_functions(self._stream_logs)
-        self._prev_statuses = self.get_function_statuses()
+
+        with self._status_lock:
+            self._status_snapshot = MappingProxyType(
+                {
+                    function.function_name: function.status
+                    for function in self._functions.values()
+                }
+            )
+            self._ready_set.update(self._functions)
+            self._completed_set.update(
+                name
+                for name, status in self._status_snapshot.items()
+                if has_completed(status)
+            )
+        self._prev_statuses = dict(self._status_snapshot)
 
         self.logger.info(
             f"Workflow {self.workflow_name} triggered with InvocationID: {self._faasr_payload['InvocationID']}"
         )
 
+        # Start monitoring function logs and receiving S3 events
+        self._logger_pool.start()
+        if self.notifier is not None:
+            self.notifier.start()
+
         # Start monitoring in background thread
         self._monitoring_thread = threading.Thread(
             target=self._start_monitoring,
@@ -595,14 +891,10 @@ class WorkflowRunner:
         Returns:
             InvocationStatus: The invocation status of the function.
         """
-        for rank in chain(
-            *(
-                self._iter_ranks(invoker)
-                for invoker in self.reverse_adj_graph[
-                    extract_function_name(function.function_name)
-                ]
-            )
-        ):
+        invokers = self._invokers_of.get(
+            extract_function_name(function.function_name), ()
+        )
+        for rank in invokers:
             if status := self._get_invocation_status(self._functions[rank], function):
                 return status
         return InvocationStatus.NOT_INVOKED
@@ -625,8 +917,8 @@ class WorkflowRunner:
             None: If the function was not invoked.
         """
         # Check if the invoker has completed and has invocations
-        if invoker.invocations is not None:
-            invocations = invoker.invocations
+        invocations = invoker.invocations
+        if invocations is not None:
             if extract_function_name(function.function_name) in invocations:
                 return InvocationStatus.INVOKED
             else:
@@ -671,28 +963,12 @@ def _main():
         # Check for changes
         for function_name, status in current_statuses.items():
             if previous_statuses[function_name] != status:
-                match status:
-                    case FunctionStatus.PENDING:
-                        print(f"⏳ {function_name}: {status.value}")
-                    case FunctionStatus.INVOKED:
-                        print(f"🚀 {function_name}: {status.value}")
-                    case FunctionStatus.NOT_INVOKED:
-                        print(f"ℹ️ {function_name}: {status.value}")
-                    case FunctionStatus.RUNNING:
-                        print(f"🔄 {function_name}: {status.value}")
-                    case FunctionStatus.COMPLETED:
-                        print(f"✅ {function_name}: {status.value}")
-                    case FunctionStatus.FAILED:
-                        print(f"‼️ {function_name}: {status.value}")
-                    case FunctionStatus.SKIPPED:
-                        print(f"  {function_name}: {status.value}")
-                    case FunctionStatus.TIMEOUT:
-                        print(f"  {function_name}: {status.value}")
+                print(f"{_EMOJI[status]} {function_name}: {status.value}")
 
         previous_statuses = current_statuses.copy()
 
-        # Wait before next check
-        time.sleep(1)
+        # Wait for the next status change
+        runner.wait_for_change(timeout=args.timeout)
 
     # Get final results
     final_statuses = runner.get_function_statuses()
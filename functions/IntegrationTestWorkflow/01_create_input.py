@@ -1,3 +1,6 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from FaaSr_py.client.py_client_stubs import (
     faasr_invocation_id,
     faasr_log,
@@ -6,9 +9,26 @@ from FaaSr_py.client.py_client_stubs import (
 
 from .utils.enums import CreateInput
 
+# Encoded once at import, since the files are written as bytes
+_INPUT_1_BYTES = CreateInput.INPUT_1_CONTENT.encode("utf-8")
+_INPUT_2_BYTES = CreateInput.INPUT_2_CONTENT.encode("utf-8")
+_INPUT_3_BYTES = CreateInput.INPUT_3_CONTENT.encode("utf-8")
+_INPUT_4_BYTES = CreateInput.INPUT_4_CONTENT.encode("utf-8")
+
 # Create input1.txt, input2.txt, input3.txt, input4.txt
 # Put them in specified s3 bucket
 
+MAX_UPLOAD_WORKERS = 4
+
+
+def _dump(local_file: str, data: bytes) -> None:
+    # The inputs are tiny, so write them with a single unbuffered write
+    fd = os.open(local_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
 
 def create_input(
     folder: str,
@@ -20,66 +40,36 @@ def create_input(
     invocation_id = faasr_invocation_id()
     faasr_log(f"Using invocation ID: {invocation_id}")
 
-    # Create input1 (input to be deleted using test_py_api)
-    with open(input1, "w") as f:
-        f.write(CreateInput.INPUT_1_CONTENT.value)
-
-    remote_file = f"{invocation_id}/{input1}"
-
-    faasr_put_file(
-        local_file=input1,
-        remote_file=remote_file,
-        remote_folder=folder,
-    )
-
-    faasr_log(
-        f"Created input1: {remote_file} with content: {CreateInput.INPUT_1_CONTENT.value}"
-    )
-
-    # Create input2
-    with open(input2, "w") as f:
-        f.write(CreateInput.INPUT_2_CONTENT.value)
-
-    remote_file = f"{invocation_id}/{input2}"
-
-    faasr_put_file(
-        local_file=input2,
-        remote_file=remote_file,
-        remote_folder=folder,
-    )
-
-    faasr_log(
-        f"Created input2: {remote_file} with content: {CreateInput.INPUT_2_CONTENT.value}"
-    )
-
-    # Create input3 (csv format, for arrow api)
-    with open(input3, "w") as f:
-        f.write(CreateInput.INPUT_3_CONTENT.value)
-
-    remote_file = f"{invocation_id}/{input3}"
-
-    faasr_put_file(
-        local_file=input3,
-        remote_file=remote_file,
-        remote_folder=folder,
-    )
-
-    faasr_log(
-        f"Created input3: {remote_file} with content: {CreateInput.INPUT_3_CONTENT.value}"
-    )
-
-    # Create input4 (input to be deleted using R API)
-    with open(input4, "w") as f:
-        f.write(CreateInput.INPUT_4_CONTENT.value)
-
-    remote_file = f"{invocation_id}/{input4}"
-
-    faasr_put_file(
-        local_file=input4,
-        remote_file=remote_file,
-        remote_folder=folder,
-    )
-
-    faasr_log(
-        f"Created input4: {remote_file} with content: {CreateInput.INPUT_4_CONTENT.value}"
-    )
+    inputs = [
+        # Create input1 (input to be deleted using test_py_api)
+        ("input1", input1, CreateInput.INPUT_1_CONTENT, _INPUT_1_BYTES),
+        # Create input2
+        ("input2", input2, CreateInput.INPUT_2_CONTENT, _INPUT_2_BYTES),
+        # Create input3 (csv format, for arrow api)
+        ("input3", input3, CreateInput.INPUT_3_CONTENT, _INPUT_3_BYTES),
+        # Create input4 (input to be deleted using R API)
+        ("input4", input4, CreateInput.INPUT_4_CONTENT, _INPUT_4_BYTES),
+    ]
+
+    def write_and_upload(local_file: str, data: bytes) -> None:
+        _dump(local_file, data)
+        faasr_put_file(
+            local_file=local_file,
+            remote_file=f"{invocation_id}/{local_file}",
+            remote_folder=folder,
+        )
+
+    # Each input is written and uploaded in its own task, so writing one file
+    # overlaps with the uploads of the others
+    with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+        put_futures = [
+            executor.submit(write_and_upload, local_file, data)
+            for _, local_file, _, data in inputs
+        ]
+        for future in as_completed(put_futures):
+            future.result()
+
+    for name, local_file, content, _ in inputs:
+        faasr_log(
+            f"Created {name}: {invocation_id}/{local_file} with content: {content}"
+        )
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from FaaSr_py.client.py_client_stubs import (
     faasr_delete_file,
     faasr_get_file,
@@ -20,42 +22,50 @@ def test_py_api(
     invocation_id = faasr_invocation_id()
     faasr_log(f"Using invocation ID: {invocation_id}")
 
-    # Test deleting input1
-    faasr_delete_file(remote_folder=folder, remote_file=f"{invocation_id}/{input1}")
-    faasr_log(f"Deleted input1: {input1}")
+    def remote_key(file_name: str) -> str:
+        return f"{invocation_id}/{file_name}"
 
-    # Test getting input2
-    remote_file = f"{invocation_id}/{input2}"
-    faasr_get_file(
-        local_file=input2,
-        remote_file=remote_file,
-        remote_folder=folder,
-    )
-    faasr_log(f"Saved remote file: {remote_file} to {input2}")
-
-    # Test getting input3
-    remote_file = f"{invocation_id}/{input3}"
-    faasr_get_file(
-        local_file=input3,
-        remote_file=remote_file,
-        remote_folder=folder,
-    )
-    faasr_log(f"Saved remote file: {remote_file} to {input3}")
+    # The delete and gets are independent, so run them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # Test deleting input1
+        delete_future = executor.submit(
+            faasr_delete_file,
+            remote_folder=folder,
+            remote_file=remote_key(input1),
+        )
+
+        # Test getting input2 and input3
+        get_futures = {
+            executor.submit(
+                faasr_get_file,
+                local_file=local_file,
+                remote_file=remote_key(local_file),
+                remote_folder=folder,
+            ): local_file
+            for local_file in (input2, input3)
+        }
+
+        delete_future.result()
+        faasr_log(f"Deleted input1: {input1}")
+
+        for future, local_file in get_futures.items():
+            future.result()
+            faasr_log(f"Saved remote file: {remote_key(local_file)} to {local_file}")
 
     # Test putting output1
     with open(output1, "w") as f:
-        f.write(TestPyApi.OUTPUT_1_CONTENT.value)
-    remote_file = f"{invocation_id}/{output1}"
+        f.write(TestPyApi.OUTPUT_1_CONTENT)
+    remote_file = remote_key(output1)
     faasr_put_file(local_file=output1, remote_file=remote_file, remote_folder=folder)
     faasr_log(
-        f"Created output file: {remote_file} with content: {TestPyApi.OUTPUT_1_CONTENT.value}"
+        f"Created output file: {remote_file} with content: {TestPyApi.OUTPUT_1_CONTENT}"
     )
 
     # Test putting output2
     with open(output2, "w") as f:
-        f.write(TestPyApi.OUTPUT_2_CONTENT.value)
-    remote_file = f"{invocation_id}/{output2}"
+        f.write(TestPyApi.OUTPUT_2_CONTENT)
+    remote_file = remote_key(output2)
     faasr_put_file(local_file=output2, remote_file=remote_file, remote_folder=folder)
     faasr_log(
-        f"Created output file: {remote_file} with content: {TestPyApi.OUTPUT_2_CONTENT.value}"
+        f"Created output file: {remote_file} with content: {TestPyApi.OUTPUT_2_CONTENT}"
     )
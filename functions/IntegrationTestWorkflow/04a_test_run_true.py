@@ -12,6 +12,8 @@ from FaaSr_py.client.py_client_stubs import (
 
 from .utils.enums import TestConditional
 
+_RUN_TRUE_BYTES = TestConditional.RUN_TRUE_CONTENT.encode("utf-8")
+
 
 def test_run_true(folder: str, output: str) -> None:
     invocation_id = faasr_invocation_id()
@@ -19,12 +21,12 @@ def test_run_true(folder: str, output: str) -> None:
 
     try:
         # Create run_true_output.txt
-        with open(output, "w") as f:
-            f.write(TestConditional.RUN_TRUE_CONTENT.value)
+        with open(output, "wb") as f:
+            f.write(_RUN_TRUE_BYTES)
         remote_file = f"{invocation_id}/{output}"
         faasr_put_file(local_file=output, remote_file=remote_file, remote_folder=folder)
         faasr_log(
-            f"Created output file: {remote_file} with content: {TestConditional.RUN_TRUE_CONTENT.value}"
+            f"Created output file: {remote_file} with content: {TestConditional.RUN_TRUE_CONTENT}"
         )
 
     except Exception as e:
@@ -11,17 +11,19 @@ from FaaSr_py.client.py_client_stubs import (
 
 from .utils.enums import TestConditional
 
+_RUN_FALSE_BYTES = TestConditional.RUN_FALSE_CONTENT.encode("utf-8")
+
 
 def test_run_false(folder: str, output: str) -> None:
     invocation_id = faasr_invocation_id()
     faasr_log(f"Using invocation ID: {invocation_id}")
 
     # Create run_false_output.txt
-    with open(output, "w") as f:
-        f.write(TestConditional.RUN_FALSE_CONTENT.value)
+    with open(output, "wb") as f:
+        f.write(_RUN_FALSE_BYTES)
 
     remote_file = f"{invocation_id}/{output}"
     faasr_put_file(local_file=output, remote_file=remote_file, remote_folder=folder)
     faasr_log(
-        f"Created output file: {remote_file} with content: {TestConditional.RUN_FALSE_CONTENT.value}"
+        f"Created output file: {remote_file} with content: {TestConditional.RUN_FALSE_CONTENT}"
     )
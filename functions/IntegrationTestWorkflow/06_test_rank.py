@@ -20,9 +20,10 @@ def test_rank(folder: str, rank_folder: str) -> None:
 
     # Create rank#.txt
     filename = f"rank{rank_number}.txt"
+    content = f"{TestRank}{rank_number}"
     with open(filename, "w") as f:
-        f.write(f"{TestRank}{rank_number}")
+        f.write(content)
 
     remote_file = f"{invocation_id}/{rank_folder}/{filename}"
     faasr_put_file(local_file=filename, remote_file=remote_file, remote_folder=folder)
-    faasr_log(f"Created file: {remote_file} with content: {TestRank}{rank_number}")
+    faasr_log(f"Created file: {remote_file} with content: {content}")
@@ -1,3 +1,6 @@
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from pathlib import Path
+
 from FaaSr_py.client.py_client_stubs import (
     faasr_get_file,
     faasr_get_folder_list,
@@ -18,45 +21,71 @@ def sync2(
 
     invocation_id = faasr_invocation_id()
     remote_prefix = f"{folder}/{invocation_id}"
+
+    def remote_key(file_name: str) -> str:
+        return f"{invocation_id}/{file_name}"
+
     folder_list = faasr_get_folder_list(prefix=remote_prefix)
+    folder_set = set(folder_list)
     faasr_log(f"List of objects in {remote_prefix}: {folder_list}")
 
     try:
         # Test if run_true_output.txt and run_false_output.txt are still in the folder
         remote_run_true_output = f"{remote_prefix}/{run_true_output}"
-        if remote_run_true_output not in folder_list:
+        if remote_run_true_output not in folder_set:
             raise AssertionError(f"{remote_run_true_output} not in {folder} folder.")
 
         remote_run_false_output = f"{remote_prefix}/{run_false_output}"
-        if remote_run_false_output not in folder_list:
+        if remote_run_false_output not in folder_set:
             raise AssertionError(f"{remote_run_false_output} not in {folder} folder.")
 
         faasr_log(f"Pass: {run_true_output} and {run_false_output} are in the folder.")
 
         remote_rank_output = f"{remote_prefix}/{rank_folder}/rank"
 
+        rank_files = {}
         for i in range(1, 6):
             remote_rank_file = f"{remote_rank_output}{i}.txt"
-            if remote_rank_file not in folder_list:
+            if remote_rank_file not in folder_set:
                 raise AssertionError(f"{remote_rank_file} not in {folder} folder.")
 
             faasr_log(f"Pass: {remote_rank_file} is in the folder.")
+            rank_files[f"rank{i}.txt"] = f"{TestRank}{i}"
 
-            remote_file = f"{invocation_id}/{rank_folder}/rank{i}.txt"
-            local_file = f"rank{i}.txt"
+        def download_and_verify(local_file: str, expected_content: str) -> str:
             faasr_get_file(
-                local_file=local_file, remote_file=remote_file, remote_folder=folder
+                local_file=local_file,
+                remote_file=remote_key(f"{rank_folder}/{local_file}"),
+                remote_folder=folder,
             )
-            with open(local_file, "r") as f:
-                content = f.read()
-                content = content.strip()
-                if content != f"{TestRank}{i}":
-                    raise AssertionError(f"Incorrect content in {local_file}")
+            content = Path(local_file).read_text().strip()
+            if content != expected_content:
+                raise AssertionError(f"Incorrect content in {local_file}")
+            return content
+
+        # The downloads are independent, so run them concurrently. Stop waiting
+        # on the first failure instead of paying for the remaining downloads.
+        executor = ThreadPoolExecutor(max_workers=len(rank_files))
+        try:
+            get_futures = {
+                local_file: executor.submit(
+                    download_and_verify, local_file, expected_content
+                )
+                for local_file, expected_content in rank_files.items()
+            }
+            done, _ = wait(get_futures.values(), return_when=FIRST_EXCEPTION)
+            for future in done:
+                if future.exception() is not None:
+                    raise future.exception()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-                faasr_log(f"Pass: {local_file} has the correct content: {content}")
+        for local_file, future in get_futures.items():
+            content = future.result()
+            faasr_log(f"Pass: {local_file} has the correct content: {content}")
 
     except AssertionError as e:
-        faasr_log(str(e))
+        faasr_log(e.args[0] if e.args else repr(e))
         return False
 
     return True
@@ -1,21 +1,26 @@
-from enum import Enum
+from typing import Final
 
+# Plain classes of string constants rather than Enums, so importing them does no
+# Enum metaclass work on function cold starts
 
-class CreateInput(Enum):
-    INPUT_1_CONTENT = "Test input1"
-    INPUT_2_CONTENT = "Test input2"
-    INPUT_3_CONTENT = "id,fruit,price\n1,apple,1.99\n2,banana,0.16\n3,strawberry,3.77\n"
-    INPUT_4_CONTENT = "Test input4"
 
+class CreateInput:
+    INPUT_1_CONTENT: Final = "Test input1"
+    INPUT_2_CONTENT: Final = "Test input2"
+    INPUT_3_CONTENT: Final = (
+        "id,fruit,price\n1,apple,1.99\n2,banana,0.16\n3,strawberry,3.77\n"
+    )
+    INPUT_4_CONTENT: Final = "Test input4"
 
-class TestPyApi(Enum):
-    OUTPUT_1_CONTENT = "Test output1"
-    OUTPUT_2_CONTENT = "Test output2"
 
+class TestPyApi:
+    OUTPUT_1_CONTENT: Final = "Test output1"
+    OUTPUT_2_CONTENT: Final = "Test output2"
 
-class TestConditional(Enum):
-    RUN_TRUE_CONTENT = "test_run_true invoked"
-    RUN_FALSE_CONTENT = "test_run_false invoked"
+
+class TestConditional:
+    RUN_TRUE_CONTENT: Final = "test_run_true invoked"
+    RUN_FALSE_CONTENT: Final = "test_run_false invoked"
 
 
 TestRank = "Test input for rank "
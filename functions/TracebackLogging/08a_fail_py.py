@@ -1,8 +1,11 @@
 from .utils.enums import TracebackLoggingTestValue
 
+_INSIDE_EXCEPTION = TracebackLoggingTestValue.INSIDE_EXCEPTION.value
+_OUTSIDE_EXCEPTION = TracebackLoggingTestValue.OUTSIDE_EXCEPTION.value
+
 
 def fail_py():
     try:
-        raise Exception(TracebackLoggingTestValue.INSIDE_EXCEPTION.value)
+        raise Exception(_INSIDE_EXCEPTION)
     except Exception as e:
-        raise Exception(TracebackLoggingTestValue.OUTSIDE_EXCEPTION.value) from e
+        raise Exception(_OUTSIDE_EXCEPTION) from e
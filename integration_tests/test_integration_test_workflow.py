@@ -19,13 +19,13 @@ def test_create_input(tester: WorkflowTester):
     tester.wait_for("create-input")
     tester.assert_function_completed("create-input")
     tester.assert_object_exists("input1.txt")
-    tester.assert_content_equals("input1.txt", CreateInput.INPUT_1_CONTENT.value)
+    tester.assert_content_equals("input1.txt", CreateInput.INPUT_1_CONTENT)
     tester.assert_object_exists("input2.txt")
-    tester.assert_content_equals("input2.txt", CreateInput.INPUT_2_CONTENT.value)
+    tester.assert_content_equals("input2.txt", CreateInput.INPUT_2_CONTENT)
     tester.assert_object_exists("input3.txt")
-    tester.assert_content_equals("input3.txt", CreateInput.INPUT_3_CONTENT.value)
+    tester.assert_content_equals("input3.txt", CreateInput.INPUT_3_CONTENT)
     tester.assert_object_exists("input4.txt")
-    tester.assert_content_equals("input4.txt", CreateInput.INPUT_4_CONTENT.value)
+    tester.assert_content_equals("input4.txt", CreateInput.INPUT_4_CONTENT)
 
     tester.assert_object_does_not_exist("does_not_exist.txt")
 
@@ -37,9 +37,9 @@ def test_py_api(tester: WorkflowTester):
     tester.assert_object_exists("input2.txt")
     tester.assert_object_exists("input3.txt")
     tester.assert_object_exists("output1-py.txt")
-    tester.assert_content_equals("output1-py.txt", TestPyApi.OUTPUT_1_CONTENT.value)
+    tester.assert_content_equals("output1-py.txt", TestPyApi.OUTPUT_1_CONTENT)
     tester.assert_object_exists("output2-py.txt")
-    tester.assert_content_equals("output2-py.txt", TestPyApi.OUTPUT_2_CONTENT.value)
+    tester.assert_content_equals("output2-py.txt", TestPyApi.OUTPUT_2_CONTENT)
 
     tester.assert_object_does_not_exist("does_not_exist.txt")
 
@@ -51,9 +51,9 @@ def test_r_api(tester: WorkflowTester):
     tester.assert_object_exists("input2.txt")
     tester.assert_object_exists("input3.txt")
     tester.assert_object_exists("output1-R.txt")
-    tester.assert_content_equals("output1-R.txt", TestPyApi.OUTPUT_1_CONTENT.value)
+    tester.assert_content_equals("output1-R.txt", TestPyApi.OUTPUT_1_CONTENT)
     tester.assert_object_exists("output2-R.txt")
-    tester.assert_content_equals("output2-R.txt", TestPyApi.OUTPUT_2_CONTENT.value)
+    tester.assert_content_equals("output2-R.txt", TestPyApi.OUTPUT_2_CONTENT)
 
     tester.assert_object_does_not_exist("does_not_exist.txt")
 
@@ -68,7 +68,7 @@ def test_run_true(tester: WorkflowTester):
     tester.assert_function_completed("test-run-true")
     tester.assert_object_exists("run_true_output.txt")
     tester.assert_content_equals(
-        "run_true_output.txt", TestConditional.RUN_TRUE_CONTENT.value
+        "run_true_output.txt", TestConditional.RUN_TRUE_CONTENT
     )
 
 
@@ -82,7 +82,7 @@ def test_run_false(tester: WorkflowTester):
     tester.assert_function_completed("test-run-false")
     tester.assert_object_exists("run_false_output.txt")
     tester.assert_content_equals(
-        "run_false_output.txt", TestConditional.RUN_FALSE_CONTENT.value
+        "run_false_output.txt", TestConditional.RUN_FALSE_CONTENT
     )
 
 
@@ -0,0 +1,200 @@
+import time
+
+import pytest
+from botocore.stub import Stubber
+
+from framework.faasr_function_logger import FaaSrFunctionLogger, LogEvent
+from framework.s3_client import FaaSrS3Client, S3Object, S3ObjectInfo
+from framework.utils import split_log_entries
+
+LOGS_KEY = "inv/func.txt"
+INTERVAL_SECONDS = 5
+
+
+class StubS3Client:
+    """
+    An in-memory stand-in for `FaaSrS3Client.get_object_if_changed`.
+
+    Each `put` replaces the object and gives it a new ETag. Setting `empty_range`
+    mimics S3 answering a 416 for a range past the end of the object, which
+    `FaaSrS3Client` returns as an empty body.
+    """
+
+    def __init__(self):
+        self.objects: dict[str, tuple[str, bytes]] = {}
+        self.empty_range = False
+        self.gets = 0
+
+    def put(self, key: str, body: bytes) -> S3ObjectInfo:
+        etag = f'"{len(self.objects.get(key, ("", b""))[1])}-{len(body)}"'
+        self.objects[key] = (etag, body)
+        return S3ObjectInfo(size=len(body), etag=etag)
+
+    def get_object_if_changed(
+        self, key: str, etag: str | None = None, range_start: int = 0
+    ) -> S3Object | None:
+        self.gets += 1
+        if key not in self.objects:
+            return None
+
+        current_etag, body = self.objects[key]
+        if current_etag == etag:
+            return S3Object(body=b"", etag=etag, not_modified=True)
+        if self.empty_range:
+            return S3Object(body=b"", etag=current_etag)
+        return S3Object(body=body[range_start:], etag=current_etag)
+
+
+class StubLoggerPool:
+    """A stand-in for `FaaSrLoggerPool` that records calls instead of polling."""
+
+    def __init__(self):
+        self.interval_seconds = INTERVAL_SECONDS
+        self.registered = []
+        self.wakes = []
+
+    def register(self, logger: FaaSrFunctionLogger) -> None:
+        self.registered.append(logger)
+
+    def unregister(self, logger: FaaSrFunctionLogger) -> None:
+        self.registered.remove(logger)
+
+    def wake_after(self, delay: float) -> None:
+        self.wakes.append(delay)
+
+
+@pytest.fixture
+def s3_client():
+    return StubS3Client()
+
+
+@pytest.fixture
+def logger(s3_client):
+    logger = FaaSrFunctionLogger(
+        function_name="func",
+        workflow_name="workflow",
+        invocation_folder="inv",
+        s3_client=s3_client,
+        logger_pool=StubLoggerPool(),
+    )
+    logger.start()
+    return logger
+
+
+def test_split_log_entries_holds_back_trailing_partial_entry():
+    data = b"[1.0] first\n[2.0] second\ncontinued\n[3.0] partial"
+
+    entries, end = split_log_entries(data)
+
+    assert entries == ["[1.0] first", "[2.0] second\ncontinued"]
+    assert data[end:] == b"\n[3.0] partial"
+
+
+def test_split_log_entries_final_returns_last_entry():
+    data = b"[1.0] first\n[2.0] last\n\n"
+
+    entries, end = split_log_entries(data, final=True)
+
+    assert entries == ["[1.0] first", "[2.0] last"]
+    assert data[end:] == b"\n\n"
+
+
+def test_split_log_entries_without_complete_entry():
+    assert split_log_entries(b"[1.0] partial") == ([], 0)
+    assert split_log_entries(b"", final=True) == ([], 0)
+
+
+def test_poll_joins_entry_split_across_fetches(logger, s3_client):
+    listed_at = time.monotonic()
+    first = b"[1.0] first\n[2.0] sec"
+    second = first + b"ond\ncontinued\n[3.0] third\n"
+
+    assert logger.poll(s3_client.put(LOGS_KEY, first), listed_at)
+    assert logger.logs == ["[1.0] first", "[2.0] sec"]
+
+    assert logger.poll(s3_client.put(LOGS_KEY, second), listed_at)
+    assert logger.logs == ["[1.0] first", "[2.0] second\ncontinued", "[3.0] third"]
+
+
+def test_poll_skips_fetch_for_unchanged_etag(logger, s3_client):
+    listed_at = time.monotonic()
+    logs_object = s3_client.put(LOGS_KEY, b"[1.0] first\n")
+
+    assert logger.poll(logs_object, listed_at)
+    assert not logger.poll(logs_object, listed_at)
+    assert s3_client.gets == 1
+
+
+def test_poll_empty_range_is_not_new_logs(logger, s3_client):
+    events = []
+    logger.register_callback(events.append)
+    listed_at = time.monotonic()
+    assert logger.poll(s3_client.put(LOGS_KEY, b"[1.0] first\n"), listed_at)
+
+    # The object changed, but S3 answered the range request with a 416
+    s3_client.empty_range = True
+    logs_object = s3_client.put(LOGS_KEY, b"[1.0] first\n")
+
+    assert not logger.poll(logs_object, listed_at)
+    assert logger.logs == ["[1.0] first"]
+    assert events == [LogEvent.LOG_CREATED, LogEvent.LOG_UPDATED]
+
+    # The new ETag is recorded, so the next cycle does not fetch again
+    assert not logger.poll(logs_object, listed_at)
+    assert s3_client.gets == 2
+
+
+def test_poll_completes_only_after_grace_period_without_new_bytes(logger, s3_client):
+    events = []
+    logger.register_callback(events.append)
+    logs_object = s3_client.put(LOGS_KEY, b"[1.0] first\n")
+    assert logger.poll(logs_object, time.monotonic())
+
+    logger.stop()
+    stopped_at = logger._stop_requested_at
+    assert logger.logger_pool.wakes == [INTERVAL_SECONDS]
+
+    # Within the grace period, no new bytes is not enough to complete
+    assert not logger.poll(logs_object, stopped_at + INTERVAL_SECONDS - 1)
+    assert not logger.logs_complete
+
+    # After the grace period, new bytes still delay completion
+    logs_object = s3_client.put(LOGS_KEY, b"[1.0] first\n[2.0] last\n")
+    assert logger.poll(logs_object, stopped_at + INTERVAL_SECONDS)
+    assert not logger.logs_complete
+
+    # The first cycle after the grace period with no new bytes completes the logs
+    assert not logger.poll(logs_object, stopped_at + 2 * INTERVAL_SECONDS)
+    assert logger.logs_complete
+    assert logger.logs == ["[1.0] first", "[2.0] last"]
+    assert logger.logger_pool.registered == []
+    assert events[-1] == LogEvent.LOG_COMPLETE
+
+
+def test_get_object_if_changed_returns_empty_body_for_416():
+    s3_client = FaaSrS3Client(
+        workflow_data={
+            "DefaultDataStore": "S3",
+            "DataStores": {"S3": {"Region": "us-east-1", "Bucket": "bucket"}},
+        },
+        access_key="test-access-key",
+        secret_key="test-secret-key",
+    )
+
+    with Stubber(s3_client._client._client) as stubber:
+        stubber.add_client_error(
+            "get_object",
+            service_error_code="InvalidRange",
+            http_status_code=416,
+            response_meta={"HTTPHeaders": {"etag": '"new"'}},
+            expected_params={
+                "Bucket": "bucket",
+                "Key": LOGS_KEY,
+                "IfNoneMatch": '"old"',
+                "Range": "bytes=12-",
+            },
+        )
+
+        logs = s3_client.get_object_if_changed(LOGS_KEY, '"old"', range_start=12)
+
+    assert logs == S3Object(body=b"", etag='"new"')